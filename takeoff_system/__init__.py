@@ -88,6 +88,7 @@ from .pdf_extractor import (
     extract_schedule_tables,
     extract_luminaire_schedule,
     extract_panel_schedule,
+    extract_all_schedules,
     extract_conduit_lengths,
     extract_floor_plan_data,
     get_pdf_page_count,
@@ -186,6 +187,7 @@ __all__ = [
     "extract_schedule_tables",
     "extract_luminaire_schedule",
     "extract_panel_schedule",
+    "extract_all_schedules",
     "extract_conduit_lengths",
     "extract_floor_plan_data",
     "get_pdf_page_count",
@@ -15,9 +15,15 @@ Key functions:
 - extract_demo_items(): Extract demolition counts from E100
 - extract_technology(): Extract technology (data) counts from T200
 """
+import os
 import re
-from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+from array import array
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 try:
     import pdfplumber
@@ -29,13 +35,167 @@ try:
 except ImportError:
     fitz = None
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from .models import DeviceCounts
 
 
+# =============================================================================
+# SHARED PAGE CACHE (one open PDF, lazily extracted words/text per page)
+# =============================================================================
+
+# Column-wise view of a page's words: float arrays x0, x1, top and string
+# arrays text (as extracted) and upper (upper-cased)
+_WordArrays = namedtuple('_WordArrays', 'x0 x1 top text upper')
+_WORD_FIELDS = itemgetter('x0', 'x1', 'top', 'text')
+
+
+class _PageCache:
+    """
+    Keeps one pdfplumber document open and memoizes per-page extraction.
+
+    extract_words() and extract_text() each re-run pdfminer layout analysis,
+    so extractors that read the same sheet share results through this cache
+    instead of reopening the PDF. Vector drawings are parsed with PyMuPDF,
+    from a second document opened on first use.
+    """
+
+    def __init__(self, pdf, pdf_path: Optional[str] = None):
+        self.pdf = pdf
+        self.pdf_path = pdf_path
+        self.fitz_doc = None
+        self.words = {}
+        self.word_arrays = {}
+        self.plan_masks = {}
+        self.text = {}
+        self.tables = {}
+        self.drawings = {}
+
+    @classmethod
+    def open(cls, pdf_path: str) -> "_PageCache":
+        if pdfplumber is None:
+            raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
+        return cls(pdfplumber.open(pdf_path), pdf_path)
+
+    def __enter__(self) -> "_PageCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.pdf.close()
+        if self.fitz_doc is not None:
+            self.fitz_doc.close()
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pdf.pages)
+
+    def get_page(self, page_num: int):
+        return self.pdf.pages[page_num]
+
+    def get_words(self, page_num: int) -> List[dict]:
+        if page_num not in self.words:
+            self.words[page_num] = self.pdf.pages[page_num].extract_words()
+            self._release_page(page_num)
+        return self.words[page_num]
+
+    def get_word_arrays(self, page_num: int) -> _WordArrays:
+        if page_num not in self.word_arrays:
+            self.word_arrays[page_num] = _words_to_arrays(self.get_words(page_num))
+        return self.word_arrays[page_num]
+
+    def get_plan_mask(self, page_num: int, x_frac: float, y_frac: float):
+        """Mask of words inside the floor plan area (left x_frac, top y_frac of the page)."""
+        key = (page_num, x_frac, y_frac)
+        if key not in self.plan_masks:
+            page = self.get_page(page_num)
+            self.plan_masks[key] = _in_plan_mask(
+                self.get_word_arrays(page_num), page.width * x_frac, page.height * y_frac
+            )
+        return self.plan_masks[key]
+
+    def get_text(self, page_num: int) -> str:
+        if page_num not in self.text:
+            self.text[page_num] = self.pdf.pages[page_num].extract_text() or ""
+            self._release_page(page_num)
+        return self.text[page_num]
+
+    def _release_page(self, page_num: int) -> None:
+        # Once words and text are both cached nothing here needs the page's
+        # parsed chars again, so drop pdfplumber's per-page layout caches
+        # instead of keeping every sheet's objects alive until close()
+        if page_num in self.words and page_num in self.text:
+            self.pdf.pages[page_num].close()
+
+    def get_tables(self, page_num: int) -> List[List[List[str]]]:
+        if page_num not in self.tables:
+            self.tables[page_num] = _page_tables(self.pdf.pages[page_num])
+        return self.tables[page_num]
+
+    def get_drawings(self, page_num: int) -> Tuple[tuple, ...]:
+        """Normalized vector drawings for a page (see _normalize_drawings)."""
+        if page_num not in self.drawings:
+            if self.fitz_doc is None:
+                self.fitz_doc = fitz.open(self.pdf_path)
+            self.drawings[page_num] = _normalize_drawings(self.fitz_doc[page_num].get_cdrawings())
+        return self.drawings[page_num]
+
+
+def _words_to_arrays(words: List[dict]) -> _WordArrays:
+    """
+    Convert pdfplumber word dicts into contiguous per-field NumPy arrays.
+
+    Coordinates stay float64 and text keeps its full length, so masks and
+    comparisons give the same results as on the original dicts.
+    """
+    # One pass over the word dicts, then split the tuples into columns
+    rows = list(map(_WORD_FIELDS, words))
+    x0, x1, top, text = zip(*rows) if rows else ((), (), (), ())
+    text = np.array(text, dtype=str)
+    return _WordArrays(
+        x0=np.array(x0, dtype=float),
+        x1=np.array(x1, dtype=float),
+        top=np.array(top, dtype=float),
+        text=text,
+        upper=np.char.upper(text),
+    )
+
+
+def _in_plan_mask(words: _WordArrays, x_max: float, y_max: float):
+    """Boolean mask of words inside the floor plan area (left of x_max, above y_max)."""
+    return (words.x0 <= x_max) & (words.top <= y_max)
+
+
+def _count_matches(pattern: re.Pattern, text: str) -> int:
+    """Count non-overlapping matches without building a list of them."""
+    return sum(1 for _ in pattern.finditer(text))
+
+
+@contextmanager
+def _page_cache_for(pdf_path: str, cache: Optional[_PageCache] = None):
+    """Yield the caller's cache, or open (and afterwards close) a new one."""
+    if cache is not None:
+        yield cache
+        return
+
+    with _PageCache.open(pdf_path) as new_cache:
+        yield new_cache
+
+
 # =============================================================================
 # SHEET PAGE DETECTION (Auto-detect sheet numbers from title blocks)
 # =============================================================================
 
+# Sheet number patterns - industry standard electrical sheet numbering
+# E-series: Electrical, T-series: Technology/Telecom
+_SHEET_NUMBER_REGEX = re.compile(r'\b([ET]\d{3})\b', re.IGNORECASE)
+
+
 def detect_sheet_pages(pdf_path: str) -> Dict[str, int]:
     """
     Scan all pages and extract sheet numbers from title blocks.
@@ -55,10 +215,6 @@ def detect_sheet_pages(pdf_path: str) -> Dict[str, int]:
 
     sheet_map = {}
 
-    # Sheet number patterns - industry standard electrical sheet numbering
-    # E-series: Electrical, T-series: Technology/Telecom
-    sheet_pattern = re.compile(r'\b([ET]\d{3})\b', re.IGNORECASE)
-
     with pdfplumber.open(pdf_path) as pdf:
         for page_idx, page in enumerate(pdf.pages):
             width = page.width
@@ -78,13 +234,13 @@ def detect_sheet_pages(pdf_path: str) -> Dict[str, int]:
             title_text = title_block.extract_text() or ""
 
             # Also check a wider area if nothing found
-            if not sheet_pattern.search(title_text):
+            if not _SHEET_NUMBER_REGEX.search(title_text):
                 wider_bbox = (width * 0.70, height * 0.80, width, height)
                 wider_area = page.crop(wider_bbox)
                 title_text = wider_area.extract_text() or ""
 
             # Find sheet numbers
-            matches = sheet_pattern.findall(title_text)
+            matches = _SHEET_NUMBER_REGEX.findall(title_text)
 
             if matches:
                 # Take the first match (most likely the sheet number)
@@ -151,8 +307,27 @@ DOUBLED_FIXTURE_REGEX = re.compile(
     re.IGNORECASE
 )
 
+# Same tags as DOUBLED_FIXTURE_REGEX, with one named group per fixture type
+# (quad-doubled spellings share their type's group) so m.lastgroup is the
+# fixture type itself. Within a group the longer spelling comes first, and
+# F4E/F7E precede F4/F7.
+_FIXTURE_NAMED_RE = re.compile(
+    r'(?P<F5>FFFF5555|FF55)|(?P<X1>XXXX1111|XX11)|(?P<X2>XXXX2222|XX22)'
+    r'|(?P<F10>FF1100)|(?P<F11>FF1111)|(?P<F4E>FF44EE)|(?P<F7E>FF77EE)'
+    r'|(?P<F2>FF22)|(?P<F3>FF33)|(?P<F4>FF44)'
+    r'|(?P<F7>FF77)|(?P<F8>FF88)|(?P<F9>FF99)',
+    re.IGNORECASE
+)
+
+# Every case variant of the two characters all tags start with
+_FIXTURE_TAG_PREFIXES = ('FF', 'XX', 'ff', 'xx', 'Ff', 'fF', 'Xx', 'xX')
+
 
-def extract_fixture_counts(pdf_path: str, page_num: int) -> Dict[str, int]:
+def extract_fixture_counts(
+    pdf_path: str,
+    page_num: int,
+    cache: Optional[_PageCache] = None
+) -> Dict[str, int]:
     """
     Extract fixture counts by finding doubled-character patterns in PDF text.
 
@@ -162,6 +337,7 @@ def extract_fixture_counts(pdf_path: str, page_num: int) -> Dict[str, int]:
     Args:
         pdf_path: Path to the PDF file
         page_num: Page number (0-indexed)
+        cache: Optional _PageCache to read the page from an already-open PDF
 
     Returns:
         Dictionary mapping fixture types to counts (e.g., {'F2': 6, 'F3': 10})
@@ -169,30 +345,66 @@ def extract_fixture_counts(pdf_path: str, page_num: int) -> Dict[str, int]:
     if pdfplumber is None:
         raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
 
-    counts = defaultdict(int)
+    with _page_cache_for(pdf_path, cache) as cache:
+        if page_num >= cache.page_count:
+            raise ValueError(f"Page {page_num} not found in PDF (has {cache.page_count} pages)")
 
-    with pdfplumber.open(pdf_path) as pdf:
-        if page_num >= len(pdf.pages):
-            raise ValueError(f"Page {page_num} not found in PDF (has {len(pdf.pages)} pages)")
+        text = cache.get_text(page_num)
 
-        page = pdf.pages[page_num]
-        text = page.extract_text() or ""
+    return _count_fixture_tags(text)
 
-        # Find all doubled-character fixture patterns
-        matches = DOUBLED_FIXTURE_REGEX.findall(text)
 
-        for match in matches:
-            match_upper = match.upper()
-            if match_upper in FIXTURE_PATTERNS:
-                fixture_type = FIXTURE_PATTERNS[match_upper]
-                counts[fixture_type] += 1
+def _extract_fixture_counts_fast(pdf_path: str, page_num: int) -> Dict[str, int]:
+    """
+    Extract fixture counts using PyMuPDF's raw text stream.
+
+    Same tag matching as extract_fixture_counts, but reads the page with
+    MuPDF's get_text("text", sort=False) instead of pdfplumber's layout-aware
+    extract_text, which is much faster on dense floor plans. Characters come
+    out in content-stream order, so verify the counts against
+    extract_fixture_counts before relying on this for a new drawing set.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_num: Page number (0-indexed)
+
+    Returns:
+        Dictionary mapping fixture types to counts (e.g., {'F2': 6, 'F3': 10})
+    """
+    if fitz is None:
+        raise ImportError("PyMuPDF required. Install with: pip install pymupdf")
+
+    doc = fitz.open(pdf_path)
+
+    if page_num >= doc.page_count:
+        page_count = doc.page_count
+        doc.close()
+        raise ValueError(f"Page {page_num} not found in PDF (has {page_count} pages)")
+
+    text = doc[page_num].get_text("text", sort=False)
+    doc.close()
+
+    return _count_fixture_tags(text)
+
+
+def _count_fixture_tags(text: str) -> Dict[str, int]:
+    """Count doubled-character fixture tags in a block of text."""
+    # Every tag starts with a doubled F or X; pages without one (panel
+    # schedules, notes) are rejected with plain substring checks
+    if not any(prefix in text for prefix in _FIXTURE_TAG_PREFIXES):
+        return {}
+
+    # Each named group is exactly one fixture type
+    counts = Counter(match.lastgroup for match in _FIXTURE_NAMED_RE.finditer(text))
 
     return dict(counts)
 
 
 def extract_fixture_counts_all_floors(
     pdf_path: str,
-    floor_pages: Dict[str, int]
+    floor_pages: Dict[str, int],
+    parallel: bool = False,
+    cache: Optional[_PageCache] = None
 ) -> Dict[str, int]:
     """
     Extract fixture counts from multiple floor plan pages.
@@ -201,25 +413,53 @@ def extract_fixture_counts_all_floors(
         pdf_path: Path to the PDF file
         floor_pages: Dictionary mapping floor names to page numbers
                     e.g., {'E200': 2, 'E201': 3}
+        parallel: Read pages in worker processes instead of serially; only
+                  worth it for several large, dense sheets
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Aggregated fixture counts across all floors
     """
-    total_counts = defaultdict(int)
-
-    for floor_name, page_num in floor_pages.items():
+    total_counts = Counter()
+
+    if parallel:
+        # Worker processes open the PDF themselves
+        page_results = _run_per_page(
+            extract_fixture_counts, pdf_path, floor_pages.values(), parallel=True
+        )
+    elif cache is not None:
+        page_results = _run_per_page(
+            extract_fixture_counts, pdf_path, floor_pages.values(), cache=cache
+        )
+    else:
         try:
-            floor_counts = extract_fixture_counts(pdf_path, page_num)
-            for fixture, count in floor_counts.items():
-                total_counts[fixture] += count
-            print(f"    {floor_name}: {dict(floor_counts)}")
+            cache = _PageCache.open(pdf_path)
         except Exception as e:
-            print(f"    Warning: Failed to extract from {floor_name}: {e}")
+            # Unreadable PDF: report the open error against every floor
+            page_results = dict.fromkeys(floor_pages.values(), e)
+        else:
+            with cache:
+                page_results = _run_per_page(
+                    extract_fixture_counts, pdf_path, floor_pages.values(), cache=cache
+                )
+
+    for floor_name, page_num in floor_pages.items():
+        floor_counts = page_results[page_num]
+        if isinstance(floor_counts, Exception):
+            print(f"    Warning: Failed to extract from {floor_name}: {floor_counts}")
+            continue
+
+        total_counts.update(floor_counts)
+        print(f"    {floor_name}: {dict(floor_counts)}")
 
     return dict(total_counts)
 
 
-def extract_text_with_positions(pdf_path: str, page_num: int) -> List[dict]:
+def extract_text_with_positions(
+    pdf_path: str,
+    page_num: int,
+    cache: Optional[_PageCache] = None
+) -> List[dict]:
     """
     Extract text with bounding box positions for spatial analysis.
 
@@ -228,6 +468,7 @@ def extract_text_with_positions(pdf_path: str, page_num: int) -> List[dict]:
     Args:
         pdf_path: Path to the PDF file
         page_num: Page number (0-indexed)
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         List of dictionaries with 'text', 'x0', 'y0', 'x1', 'y1' keys
@@ -235,16 +476,24 @@ def extract_text_with_positions(pdf_path: str, page_num: int) -> List[dict]:
     if pdfplumber is None:
         raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
 
+    if cache is not None:
+        # Copies, so callers can't modify the cached words
+        return [dict(word) for word in cache.get_words(page_num)]
+
     with pdfplumber.open(pdf_path) as pdf:
         page = pdf.pages[page_num]
         words = page.extract_words()
         return words
 
 
+_REGION_WORD_FIELDS = itemgetter('x0', 'x1', 'top', 'bottom', 'text')
+
+
 def extract_fixture_counts_by_region(
     pdf_path: str,
     page_num: int,
-    regions: Dict[str, Tuple[float, float, float, float]]
+    regions: Dict[str, Tuple[float, float, float, float]],
+    cache: Optional[_PageCache] = None
 ) -> Dict[str, Dict[str, int]]:
     """
     Extract fixture counts filtered by page regions.
@@ -258,84 +507,122 @@ def extract_fixture_counts_by_region(
         regions: Dictionary mapping region names to bounding boxes
                 (x0, y0, x1, y1) as fractions of page dimensions
                 e.g., {'mezzanine': (0, 0, 1, 0.36)}
+        cache: Optional _PageCache to reuse an already-open PDF and its words
 
     Returns:
         Dictionary mapping region names to fixture counts
     """
     if pdfplumber is None:
         raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
+    if np is None:
+        raise ImportError("NumPy required. Install with: pip install numpy")
 
-    results = {}
-
-    with pdfplumber.open(pdf_path) as pdf:
-        page = pdf.pages[page_num]
+    with _page_cache_for(pdf_path, cache) as cache:
+        page = cache.get_page(page_num)
         width = page.width
         height = page.height
-        words = page.extract_words()
-
-        for region_name, (x0_pct, y0_pct, x1_pct, y1_pct) in regions.items():
-            # Convert percentages to absolute coordinates
-            x0 = x0_pct * width
-            y0 = y0_pct * height
-            x1 = x1_pct * width
-            y1 = y1_pct * height
-
-            # Filter words in this region
-            region_text = ""
-            for word in words:
-                word_x = (word['x0'] + word['x1']) / 2
-                word_y = (word['top'] + word['bottom']) / 2
-                if x0 <= word_x <= x1 and y0 <= word_y <= y1:
-                    region_text += " " + word['text']
-
-            # Count fixtures in this region
-            counts = defaultdict(int)
-            matches = DOUBLED_FIXTURE_REGEX.findall(region_text)
-            for match in matches:
-                match_upper = match.upper()
-                if match_upper in FIXTURE_PATTERNS:
-                    fixture_type = FIXTURE_PATTERNS[match_upper]
-                    counts[fixture_type] += 1
-
-            results[region_name] = dict(counts)
+        words = cache.get_words(page_num)
 
-    return results
+    # Word midpoints as columns, so each region is one vectorized mask
+    if words:
+        x0s, x1s, tops, bottoms, texts = map(np.array, zip(*map(_REGION_WORD_FIELDS, words)))
+    else:
+        x0s = x1s = tops = bottoms = np.empty(0)
+        texts = np.empty(0, dtype=str)
+    word_x = (x0s + x1s) / 2
+    word_y = (tops + bottoms) / 2
+
+    region_words = {}
+    for region_name, (x0_pct, y0_pct, x1_pct, y1_pct) in regions.items():
+        # Convert percentages to absolute coordinates
+        in_region = (
+            (word_x >= x0_pct * width) & (word_x <= x1_pct * width)
+            & (word_y >= y0_pct * height) & (word_y <= y1_pct * height)
+        )
+        region_words[region_name] = texts[in_region].tolist()
+
+    # Count fixtures in each region
+    return {
+        region_name: _count_fixture_tags(" ".join(region_words[region_name]))
+        for region_name in regions
+    }
 
 
 # =============================================================================
 # TABLE EXTRACTION (pdfplumber)
 # =============================================================================
 
-def extract_schedule_tables(pdf_path: str, page_num: int) -> List[List[List[str]]]:
+def extract_schedule_tables(
+    pdf_path: str,
+    page_num: int,
+    cache: Optional[_PageCache] = None
+) -> List[List[List[str]]]:
     """
     Extract tables from schedule sheets (E600, E700).
 
     Args:
         pdf_path: Path to the PDF file
         page_num: Page number (0-indexed)
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         List of tables, where each table is a list of rows,
         and each row is a list of cell strings
     """
-    if pdfplumber is None:
-        raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
+    with _page_cache_for(pdf_path, cache) as cache:
+        return cache.get_tables(page_num)
 
-    tables = []
 
-    with pdfplumber.open(pdf_path) as pdf:
-        page = pdf.pages[page_num]
-        found_tables = page.find_tables()
+def _page_tables(page) -> List[List[List[str]]]:
+    """Run find_tables() on an already-open pdfplumber page and extract each table."""
+    tables = []
 
-        for table in found_tables:
-            extracted = table.extract()
-            if extracted:
-                tables.append(extracted)
+    for table in page.find_tables():
+        extracted = table.extract()
+        if extracted:
+            tables.append(extracted)
 
     return tables
 
 
-def extract_luminaire_schedule(pdf_path: str, page_num: int) -> Dict[str, dict]:
+def extract_all_schedules(
+    pdf_path: str,
+    luminaire_page: int,
+    panel_page: int,
+    cache: Optional[_PageCache] = None
+) -> Dict[str, Dict[str, dict]]:
+    """
+    Extract the luminaire (E600) and panel (E700) schedules together.
+
+    Opens the PDF once and runs table detection once per page (once in
+    total if both schedules are on the same sheet), instead of the two
+    separate passes made by calling both schedule extractors.
+
+    Args:
+        pdf_path: Path to the PDF file
+        luminaire_page: Page number for E600 (0-indexed)
+        panel_page: Page number for E700 (0-indexed)
+        cache: Optional _PageCache to reuse an already-open PDF
+
+    Returns:
+        Dictionary with 'luminaires' (as from extract_luminaire_schedule)
+        and 'panels' (as from extract_panel_schedule)
+    """
+    with _page_cache_for(pdf_path, cache) as cache:
+        luminaire_tables = cache.get_tables(luminaire_page)
+        panel_tables = cache.get_tables(panel_page)
+
+    return {
+        'luminaires': _parse_luminaire_tables(luminaire_tables),
+        'panels': _parse_panel_tables(panel_tables),
+    }
+
+
+def extract_luminaire_schedule(
+    pdf_path: str,
+    page_num: int,
+    cache: Optional[_PageCache] = None
+) -> Dict[str, dict]:
     """
     Extract LED Luminaire Schedule from E600 sheet.
 
@@ -344,12 +631,16 @@ def extract_luminaire_schedule(pdf_path: str, page_num: int) -> Dict[str, dict]:
     Args:
         pdf_path: Path to the PDF file
         page_num: Page number for E600 (0-indexed)
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Dictionary mapping fixture types to specifications
     """
-    tables = extract_schedule_tables(pdf_path, page_num)
+    return _parse_luminaire_tables(extract_schedule_tables(pdf_path, page_num, cache))
+
 
+def _parse_luminaire_tables(tables: List[List[List[str]]]) -> Dict[str, dict]:
+    """Build fixture specifications from extracted E600 tables."""
     luminaire_data = {}
 
     for table in tables:
@@ -377,7 +668,11 @@ def extract_luminaire_schedule(pdf_path: str, page_num: int) -> Dict[str, dict]:
     return luminaire_data
 
 
-def extract_panel_schedule(pdf_path: str, page_num: int) -> Dict[str, dict]:
+def extract_panel_schedule(
+    pdf_path: str,
+    page_num: int,
+    cache: Optional[_PageCache] = None
+) -> Dict[str, dict]:
     """
     Extract Panel Schedule from E700 sheet.
 
@@ -386,12 +681,16 @@ def extract_panel_schedule(pdf_path: str, page_num: int) -> Dict[str, dict]:
     Args:
         pdf_path: Path to the PDF file
         page_num: Page number for E700 (0-indexed)
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Dictionary with panel and breaker information
     """
-    tables = extract_schedule_tables(pdf_path, page_num)
+    return _parse_panel_tables(extract_schedule_tables(pdf_path, page_num, cache))
 
+
+def _parse_panel_tables(tables: List[List[List[str]]]) -> Dict[str, dict]:
+    """Tally breaker sizes from extracted E700 tables."""
     panel_data = {
         'panels': [],
         'breakers': defaultdict(int),
@@ -421,10 +720,38 @@ def extract_panel_schedule(pdf_path: str, page_num: int) -> Dict[str, dict]:
 # E600 FIXTURE SCHEDULE PARSING (Enhanced for Linear LEDs and Pendants)
 # =============================================================================
 
+# Fixture IDs in the schedule's first column: F2, F4E, X1, ...
+_FIXTURE_ID_RE = re.compile(r'(?:F\d+E?|X\d+)\Z')
+
+# Schedule text patterns. These run against upper-cased text, so they are
+# written in upper case and compiled without re.IGNORECASE.
+# Linear LEDs: "F9-4" (F9 type, 4' length) or "4' LINEAR"
+_SCHEDULE_LINEAR_PATTERNS = [
+    (re.compile(r"(?:F9[- ]?)?4['\"]?\s*(?:LINEAR|LED)"), "4' Linear LED"),
+    (re.compile(r"(?:F9[- ]?)?6['\"]?\s*(?:LINEAR|LED)"), "6' Linear LED"),
+    (re.compile(r"(?:F9[- ]?)?8['\"]?\s*(?:LINEAR|LED)"), "8' Linear LED"),
+    (re.compile(r"(?:F9[- ]?)?10['\"]?\s*(?:LINEAR|LED)"), "10' Linear LED"),
+    (re.compile(r"(?:F9[- ]?)?16['\"]?\s*(?:LINEAR|LED)"), "16' Linear LED"),
+]
+
+# Pendants: F10-22 = 22' linear pendant, F10-30 = 30' linear pendant,
+# F11-4X4 = 4x4 array, F11-6X6, etc.
+_SCHEDULE_PENDANT_PATTERNS = [
+    (re.compile(r"F10[- ]?22"), "F10-22"),
+    (re.compile(r"F10[- ]?30"), "F10-30"),
+    (re.compile(r"F11[- ]?4\s*X\s*4"), "F11-4X4"),
+    (re.compile(r"F11[- ]?6\s*X\s*6"), "F11-6X6"),
+    (re.compile(r"F11[- ]?8\s*X\s*8"), "F11-8X8"),
+    (re.compile(r"F11[- ]?10\s*X\s*10"), "F11-10X10"),
+    (re.compile(r"F11[- ]?16\s*X\s*10"), "F11-16X10"),
+]
+
+
 def parse_fixture_schedule_from_pdf(
     pdf_path: str,
     e600_page: Optional[int] = None,
-    sheet_map: Optional[Dict[str, int]] = None
+    sheet_map: Optional[Dict[str, int]] = None,
+    cache: Optional[_PageCache] = None
 ) -> Dict[str, dict]:
     """
     Extract fixture definitions and counts from E600 schedule.
@@ -438,6 +765,7 @@ def parse_fixture_schedule_from_pdf(
         pdf_path: Path to the PDF file
         e600_page: Page number for E600 (0-indexed). If None, auto-detects.
         sheet_map: Optional pre-computed sheet map
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Dictionary with fixture definitions:
@@ -463,72 +791,151 @@ def parse_fixture_schedule_from_pdf(
         "standard_counts": defaultdict(int),
     }
 
-    with pdfplumber.open(pdf_path) as pdf:
-        if e600_page >= len(pdf.pages):
+    with _page_cache_for(pdf_path, cache) as cache:
+        if e600_page >= cache.page_count:
             print(f"Warning: E600 page {e600_page} not found in PDF")
             return result
 
-        page = pdf.pages[e600_page]
-        text = page.extract_text() or ""
-        tables = page.find_tables()
+        text_upper = cache.get_text(e600_page).upper()
 
         # Parse fixture schedule table
-        for table in tables:
-            extracted = table.extract()
-            if not extracted:
-                continue
-
-            for row in extracted:
+        for table in cache.get_tables(e600_page):
+            for row in table:
                 if not row or not row[0]:
                     continue
 
-                first_cell = str(row[0]).strip().upper()
+                first_cell = row[0].strip().upper()
 
                 # Standard fixtures: F2, F3, F4, etc.
-                if re.match(r'^F\d+E?$', first_cell) or re.match(r'^X\d+$', first_cell):
-                    desc = row[1] if len(row) > 1 else ""
+                if _FIXTURE_ID_RE.match(first_cell):
+                    desc = str(row[1]) if len(row) > 1 and row[1] else ""
                     result["definitions"][first_cell] = {
-                        "description": str(desc).strip() if desc else "",
-                        "category": _categorize_fixture(first_cell, str(desc) if desc else "")
+                        "description": desc.strip(),
+                        "category": _categorize_fixture(first_cell, desc)
                     }
 
         # Extract Linear LED counts from text patterns
-        # Look for patterns like "F9-4" (F9 type, 4' length) or "4' LINEAR"
-        linear_patterns = [
-            (r"(?:F9[- ]?)?4['\"]?\s*(?:LINEAR|LED)", "4' Linear LED"),
-            (r"(?:F9[- ]?)?6['\"]?\s*(?:LINEAR|LED)", "6' Linear LED"),
-            (r"(?:F9[- ]?)?8['\"]?\s*(?:LINEAR|LED)", "8' Linear LED"),
-            (r"(?:F9[- ]?)?10['\"]?\s*(?:LINEAR|LED)", "10' Linear LED"),
-            (r"(?:F9[- ]?)?16['\"]?\s*(?:LINEAR|LED)", "16' Linear LED"),
-        ]
-
-        for pattern, led_type in linear_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
+        for pattern, led_type in _SCHEDULE_LINEAR_PATTERNS:
+            if pattern.search(text_upper):
                 # Schedule shows specification, not quantities
                 # Mark as "found" - actual counts come from floor plans
                 result["linear_counts"][led_type] = 0  # Placeholder
 
         # Extract Pendant fixture patterns
-        # F10-22 = 22' linear pendant, F10-30 = 30' linear pendant
-        # F11-4X4 = 4x4 array, F11-6X6, etc.
-        pendant_patterns = [
-            (r"F10[- ]?22", "F10-22"),
-            (r"F10[- ]?30", "F10-30"),
-            (r"F11[- ]?4\s*[Xx]\s*4", "F11-4X4"),
-            (r"F11[- ]?6\s*[Xx]\s*6", "F11-6X6"),
-            (r"F11[- ]?8\s*[Xx]\s*8", "F11-8X8"),
-            (r"F11[- ]?10\s*[Xx]\s*10", "F11-10X10"),
-            (r"F11[- ]?16\s*[Xx]\s*10", "F11-16X10"),
-        ]
-
-        for pattern, pendant_type in pendant_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern, pendant_type in _SCHEDULE_PENDANT_PATTERNS:
+            if pattern.search(text_upper):
                 result["pendant_counts"][pendant_type] = 0  # Placeholder
 
     return result
 
 
+def _run_per_page(
+    func: Callable[..., Any],
+    pdf_path: str,
+    page_nums: Iterable[int],
+    parallel: bool = False,
+    cache: Optional[_PageCache] = None
+) -> Dict[int, Any]:
+    """
+    Call func(pdf_path, page_num) once for each distinct page.
+
+    Pages are independent, so this is _run_tasks with one task per page;
+    see there for the serial/parallel behaviour and error handling.
+    """
+    tasks = {page_num: (func, (pdf_path, page_num)) for page_num in sorted(set(page_nums))}
+    return _run_tasks(tasks, parallel, cache)
+
+
+def _run_tasks(
+    tasks: Dict[Any, Tuple[Callable[..., Any], tuple]],
+    parallel: bool = False,
+    cache: Optional[_PageCache] = None
+) -> Dict[Any, Any]:
+    """
+    Run independent extraction calls given as {key: (func, args)}.
+
+    Calls run serially unless parallel is True, in which case they are spread
+    across worker processes. pdfplumber objects don't pickle, so each worker
+    opens the PDF itself; that only pays off when a call takes much longer
+    than a process takes to start (large, dense sheets). Falls back to
+    running serially with a single call, a single CPU, or no process support.
+    On the serial path a given cache is passed to func as cache=... so calls
+    share one open PDF. Exceptions are returned in place of results so
+    callers can decide how to report failures.
+    """
+    results = {}
+
+    max_workers = min(len(tasks), os.cpu_count() or 1) if parallel else 1
+    if max_workers > 1:
+        try:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        except (OSError, NotImplementedError):
+            executor = None
+
+        if executor is not None:
+            with executor:
+                futures = {executor.submit(func, *args): key
+                           for key, (func, args) in tasks.items()}
+                for future in as_completed(futures):
+                    error = future.exception()
+                    results[futures[future]] = error if error is not None else future.result()
+            return results
+
+    for key, (func, args) in tasks.items():
+        try:
+            if cache is not None:
+                results[key] = func(*args, cache=cache)
+            else:
+                results[key] = func(*args)
+        except Exception as e:
+            results[key] = e
+
+    return results
+
+
+def _extract_page_text(pdf_path: str, page_num: int) -> Optional[str]:
+    """Extract one page's text (None if the page doesn't exist)."""
+    with pdfplumber.open(pdf_path) as pdf:
+        if page_num >= len(pdf.pages):
+            return None
+        return pdf.pages[page_num].extract_text() or ""
+
+
+def _extract_page_texts(
+    pdf_path: str,
+    page_nums,
+    parallel: bool = False,
+    cache: Optional[_PageCache] = None
+) -> Dict[int, str]:
+    """
+    Extract text for a set of pages, opening the PDF once.
+
+    Each distinct page is extracted only once even if several floors map
+    to it, and read from the cache when one is given. Pages beyond the end
+    of the PDF are omitted from the result. With parallel=True the pages are
+    extracted in worker processes instead (see _run_per_page), and the first
+    failure is raised as it would be serially.
+    """
+    texts_by_page = {}
+
+    if parallel:
+        for page_num, text in _run_per_page(
+            _extract_page_text, pdf_path, page_nums, parallel=True
+        ).items():
+            if isinstance(text, Exception):
+                raise text
+            if text is not None:
+                texts_by_page[page_num] = text
+        return texts_by_page
+
+    with _page_cache_for(pdf_path, cache) as cache:
+        for page_num in sorted(set(page_nums)):
+            if page_num < cache.page_count:
+                texts_by_page[page_num] = cache.get_text(page_num)
+
+    return texts_by_page
+
+
 def _categorize_fixture(fixture_type: str, description: str) -> str:
     """Categorize a fixture based on its type and description."""
     fixture_type = fixture_type.upper()
@@ -554,10 +961,104 @@ def _categorize_fixture(fixture_type: str, description: str) -> str:
         return "general"
 
 
+# Linear LED length patterns - look for F9 with length annotations
+# Common patterns: "F9-4", "F9 4'", "4' F9", etc.
+# All lengths share one alternation so each page is scanned once. Longer
+# lengths come first so "F9-16" isn't also read as a shorter tag, and the
+# doubled-character form only looks a few characters past the tag.
+_LINEAR_LENGTHS = (4, 6, 8, 10, 16)
+_LINEAR_TAG_RE = re.compile(
+    "|".join(
+        rf"(?P<L{length}>F9[- ]?{length}|{length}['\"]?\s*F9|FF99.{{0,4}}{length})"
+        for length in sorted(_LINEAR_LENGTHS, reverse=True)
+    ),
+    re.IGNORECASE
+)
+_LINEAR_GROUP_TO_TYPE = {f"L{length}": f"{length}' Linear LED" for length in _LINEAR_LENGTHS}
+
+# Pendant size patterns, in plain and doubled-character form
+_PENDANT_SIZE_PATTERNS = {
+    pendant_type: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    for pendant_type, patterns in {
+        "F10-22": [r"F10[- ]?22", r"FF1100[- ]?22"],
+        "F10-30": [r"F10[- ]?30", r"FF1100[- ]?30"],
+        "F11-4X4": [r"F11[- ]?4\s*[Xx]\s*4", r"FF1111[- ]?4\s*[Xx]\s*4"],
+        "F11-6X6": [r"F11[- ]?6\s*[Xx]\s*6", r"FF1111[- ]?6\s*[Xx]\s*6"],
+        "F11-8X8": [r"F11[- ]?8\s*[Xx]\s*8", r"FF1111[- ]?8\s*[Xx]\s*8"],
+        "F11-10X10": [r"F11[- ]?10\s*[Xx]\s*10", r"FF1111[- ]?10\s*[Xx]\s*10"],
+        "F11-16X10": [r"F11[- ]?16\s*[Xx]\s*10", r"FF1111[- ]?16\s*[Xx]\s*10"],
+    }.items()
+}
+
+# Raw doubled-character tags for F9/F10/F11
+_F9_TAG_REGEX = re.compile(r'FF99', re.IGNORECASE)
+_F10_TAG_REGEX = re.compile(r'FF1100', re.IGNORECASE)
+_F11_TAG_REGEX = re.compile(r'FF1111', re.IGNORECASE)
+
+# Linear LED length annotations next to doubled-character F9 tags
+_LINEAR_ANNOTATION_PATTERNS = {
+    led_type: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    for led_type, patterns in {
+        "4' Linear LED": [r"FF99[- /]*4['\"]?(?!\d)", r"4['\"]?\s*FF99"],
+        "6' Linear LED": [r"FF99[- /]*6['\"]?(?!\d)", r"6['\"]?\s*FF99"],
+        "8' Linear LED": [r"FF99[- /]*8['\"]?(?!\d)", r"8['\"]?\s*FF99"],
+        "10' Linear LED": [r"FF99[- /]*10['\"]?", r"10['\"]?\s*FF99"],
+        "16' Linear LED": [r"FF99[- /]*16['\"]?", r"16['\"]?\s*FF99"],
+    }.items()
+}
+
+# Typical size mixes used when a drawing carries no size annotations
+_F10_RATIOS = (("F10-22", 0.6), ("F10-30", 0.4))
+_F11_RATIOS = (
+    ("F11-4X4", 0.31),
+    ("F11-6X6", 0.23),
+    ("F11-8X8", 0.15),
+    ("F11-10X10", 0.23),
+    ("F11-16X10", 0.08),
+)
+_LINEAR_RATIOS = (
+    ("4' Linear LED", 0.31),
+    ("6' Linear LED", 0.23),
+    ("8' Linear LED", 0.15),
+    ("10' Linear LED", 0.27),
+    ("16' Linear LED", 0.04),
+)
+
+
+def _apportion(total: int, ratios: Tuple[Tuple[str, float], ...]) -> Dict[str, int]:
+    """
+    Split an integer total across categories by ratio.
+
+    Uses the largest-remainder method: each category gets the floor of its
+    share, then the leftover units go to the largest fractional parts (ties
+    go to the earlier entry). The result always sums to total.
+
+    Args:
+        total: Number of units to distribute
+        ratios: (name, ratio) pairs; ratios should sum to 1
+
+    Returns:
+        Dictionary mapping each name to its integer share
+    """
+    shares = {}
+    remainders = []
+    for index, (name, ratio) in enumerate(ratios):
+        exact = total * ratio
+        shares[name] = int(exact)
+        remainders.append((exact - shares[name], -index, name))
+
+    leftover = total - sum(shares.values())
+    for _, _, name in sorted(remainders, reverse=True)[:leftover]:
+        shares[name] += 1
+
+    return shares
+
+
 def count_linear_leds_from_floor_plans(
     pdf_path: str,
     floor_pages: Dict[str, int],
-    floor_count: int = 2
+    floor_count: int = 2,
+    parallel: bool = False
 ) -> Dict[str, int]:
     """
     Count Linear LED fixtures from floor plans by analyzing F9 tags with length annotations.
@@ -569,6 +1070,8 @@ def count_linear_leds_from_floor_plans(
         pdf_path: Path to the PDF file
         floor_pages: Dictionary mapping floor names to page numbers
         floor_count: Number of floors shown on multi-floor sheets (for deduplication)
+        parallel: Read pages in worker processes instead of serially; only
+                  worth it for several large, dense sheets
 
     Returns:
         Dictionary with Linear LED counts by length
@@ -576,30 +1079,21 @@ def count_linear_leds_from_floor_plans(
     if pdfplumber is None:
         raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
 
-    linear_counts = defaultdict(int)
+    linear_counts = Counter()
 
-    # Linear LED length patterns - look for F9 with length annotations
-    # Common patterns: "F9-4", "F9 4'", "4' F9", etc.
-    length_patterns = {
-        4: [r"F9[- ]?4", r"4['\"]?\s*F9", r"FF99.*4"],
-        6: [r"F9[- ]?6", r"6['\"]?\s*F9", r"FF99.*6"],
-        8: [r"F9[- ]?8", r"8['\"]?\s*F9", r"FF99.*8"],
-        10: [r"F9[- ]?10", r"10['\"]?\s*F9", r"FF99.*10"],
-        16: [r"F9[- ]?16", r"16['\"]?\s*F9", r"FF99.*16"],
-    }
+    texts_by_page = _extract_page_texts(pdf_path, floor_pages.values(), parallel)
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for floor_name, page_num in floor_pages.items():
-            if page_num >= len(pdf.pages):
-                continue
+    for floor_name, page_num in floor_pages.items():
+        if page_num not in texts_by_page:
+            continue
 
-            page = pdf.pages[page_num]
-            text = page.extract_text() or ""
+        text = texts_by_page[page_num]
 
-            for length, patterns in length_patterns.items():
-                for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
-                    linear_counts[f"{length}' Linear LED"] += len(matches)
+        # Every length gets an entry once a page has been scanned
+        linear_counts.update(dict.fromkeys(_LINEAR_GROUP_TO_TYPE.values(), 0))
+        linear_counts.update(
+            _LINEAR_GROUP_TO_TYPE[m.lastgroup] for m in _LINEAR_TAG_RE.finditer(text)
+        )
 
     # Adjust for multi-floor sheet duplication
     if floor_count > 1:
@@ -612,7 +1106,9 @@ def count_linear_leds_from_floor_plans(
 def count_pendants_from_floor_plans(
     pdf_path: str,
     floor_pages: Dict[str, int],
-    floor_count: int = 2
+    floor_count: int = 2,
+    parallel: bool = False,
+    cache: Optional[_PageCache] = None
 ) -> Dict[str, int]:
     """
     Count Pendant fixtures from floor plans by analyzing F10/F11 tags.
@@ -628,6 +1124,9 @@ def count_pendants_from_floor_plans(
         pdf_path: Path to the PDF file
         floor_pages: Dictionary mapping floor names to page numbers
         floor_count: Number of floors shown on multi-floor sheets
+        parallel: Read pages in worker processes instead of serially; only
+                  worth it for several large, dense sheets
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Dictionary with Pendant counts by type
@@ -635,38 +1134,27 @@ def count_pendants_from_floor_plans(
     if pdfplumber is None:
         raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
 
-    pendant_counts = defaultdict(int)
+    pendant_counts = Counter()
     f10_total = 0
     f11_total = 0
 
     # First, count total F10 and F11 fixtures
-    with pdfplumber.open(pdf_path) as pdf:
-        for floor_name, page_num in floor_pages.items():
-            if page_num >= len(pdf.pages):
-                continue
+    texts_by_page = _extract_page_texts(pdf_path, floor_pages.values(), parallel, cache)
+
+    for floor_name, page_num in floor_pages.items():
+        if page_num not in texts_by_page:
+            continue
+
+        text = texts_by_page[page_num]
 
-            page = pdf.pages[page_num]
-            text = page.extract_text() or ""
-
-            # Count raw F10 and F11 using doubled-character patterns
-            f10_total += len(re.findall(r'FF1100', text, re.IGNORECASE))
-            f11_total += len(re.findall(r'FF1111', text, re.IGNORECASE))
-
-            # Try to find specific size patterns
-            specific_patterns = {
-                "F10-22": [r"F10[- ]?22", r"FF1100[- ]?22"],
-                "F10-30": [r"F10[- ]?30", r"FF1100[- ]?30"],
-                "F11-4X4": [r"F11[- ]?4\s*[Xx]\s*4", r"FF1111[- ]?4\s*[Xx]\s*4"],
-                "F11-6X6": [r"F11[- ]?6\s*[Xx]\s*6", r"FF1111[- ]?6\s*[Xx]\s*6"],
-                "F11-8X8": [r"F11[- ]?8\s*[Xx]\s*8", r"FF1111[- ]?8\s*[Xx]\s*8"],
-                "F11-10X10": [r"F11[- ]?10\s*[Xx]\s*10", r"FF1111[- ]?10\s*[Xx]\s*10"],
-                "F11-16X10": [r"F11[- ]?16\s*[Xx]\s*10", r"FF1111[- ]?16\s*[Xx]\s*10"],
-            }
-
-            for pendant_type, patterns in specific_patterns.items():
-                for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
-                    pendant_counts[pendant_type] += len(matches)
+        # Count raw F10 and F11 using doubled-character patterns
+        f10_total += _count_matches(_F10_TAG_REGEX, text)
+        f11_total += _count_matches(_F11_TAG_REGEX, text)
+
+        # Try to find specific size patterns
+        for pendant_type, patterns in _PENDANT_SIZE_PATTERNS.items():
+            for pattern in patterns:
+                pendant_counts[pendant_type] += _count_matches(pattern, text)
 
     # F10 and F11 fixtures don't appear to have multi-floor duplication
     # (based on analysis showing raw counts match expected totals)
@@ -678,22 +1166,12 @@ def count_pendants_from_floor_plans(
         # Distribute based on typical ratios for this type of project
         # F10: typically 60% short (22'), 40% long (30')
         if f10_total > 0:
-            pendant_counts["F10-22"] = max(1, int(f10_total * 0.6))
-            pendant_counts["F10-30"] = f10_total - pendant_counts["F10-22"]
+            pendant_counts.update(_apportion(f10_total, _F10_RATIOS))
 
         # F11: distribute across sizes based on typical project mix
         # 4x4: 31%, 6x6: 23%, 8x8: 15%, 10x10: 23%, 16x10: 8%
         if f11_total > 0:
-            pendant_counts["F11-4X4"] = max(1, int(f11_total * 0.31))
-            pendant_counts["F11-6X6"] = max(1, int(f11_total * 0.23))
-            pendant_counts["F11-8X8"] = max(1, int(f11_total * 0.15))
-            pendant_counts["F11-10X10"] = max(1, int(f11_total * 0.23))
-            pendant_counts["F11-16X10"] = max(1, f11_total - sum([
-                pendant_counts["F11-4X4"],
-                pendant_counts["F11-6X6"],
-                pendant_counts["F11-8X8"],
-                pendant_counts["F11-10X10"]
-            ]))
+            pendant_counts.update(_apportion(f11_total, _F11_RATIOS))
 
     return dict(pendant_counts)
 
@@ -701,7 +1179,8 @@ def count_pendants_from_floor_plans(
 def count_linear_leds_with_distribution(
     pdf_path: str,
     floor_pages: Dict[str, int],
-    floor_count: int = 2
+    floor_count: int = 2,
+    cache: Optional[_PageCache] = None
 ) -> Dict[str, int]:
     """
     Count Linear LED fixtures and distribute by length.
@@ -713,6 +1192,7 @@ def count_linear_leds_with_distribution(
         pdf_path: Path to the PDF file
         floor_pages: Dictionary mapping floor names to page numbers
         floor_count: Number of floors for deduplication
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Dictionary with Linear LED counts by length
@@ -720,33 +1200,24 @@ def count_linear_leds_with_distribution(
     if pdfplumber is None:
         raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
 
-    linear_counts = defaultdict(int)
+    linear_counts = Counter()
     f9_total = 0
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for floor_name, page_num in floor_pages.items():
-            if page_num >= len(pdf.pages):
-                continue
+    texts_by_page = _extract_page_texts(pdf_path, floor_pages.values(), cache=cache)
 
-            page = pdf.pages[page_num]
-            text = page.extract_text() or ""
+    for floor_name, page_num in floor_pages.items():
+        if page_num not in texts_by_page:
+            continue
 
-            # Count total F9 fixtures
-            f9_total += len(re.findall(r'FF99', text, re.IGNORECASE))
+        text = texts_by_page[page_num]
 
-            # Try to find length annotations
-            length_patterns = {
-                "4' Linear LED": [r"FF99[- /]*4['\"]?(?!\d)", r"4['\"]?\s*FF99"],
-                "6' Linear LED": [r"FF99[- /]*6['\"]?(?!\d)", r"6['\"]?\s*FF99"],
-                "8' Linear LED": [r"FF99[- /]*8['\"]?(?!\d)", r"8['\"]?\s*FF99"],
-                "10' Linear LED": [r"FF99[- /]*10['\"]?", r"10['\"]?\s*FF99"],
-                "16' Linear LED": [r"FF99[- /]*16['\"]?", r"16['\"]?\s*FF99"],
-            }
+        # Count total F9 fixtures
+        f9_total += _count_matches(_F9_TAG_REGEX, text)
 
-            for led_type, patterns in length_patterns.items():
-                for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
-                    linear_counts[led_type] += len(matches)
+        # Try to find length annotations
+        for led_type, patterns in _LINEAR_ANNOTATION_PATTERNS.items():
+            for pattern in patterns:
+                linear_counts[led_type] += _count_matches(pattern, text)
 
     # Adjust for multi-floor
     f9_adjusted = f9_total // floor_count if floor_count > 1 else f9_total
@@ -761,16 +1232,7 @@ def count_linear_leds_with_distribution(
         # Typical length distribution: 4'=31%, 6'=23%, 8'=15%, 10'=27%, 16'=4%
         total_linear = f9_adjusted * 8  # Typical ratio
 
-        linear_counts["4' Linear LED"] = max(1, int(total_linear * 0.31))
-        linear_counts["6' Linear LED"] = max(1, int(total_linear * 0.23))
-        linear_counts["8' Linear LED"] = max(1, int(total_linear * 0.15))
-        linear_counts["10' Linear LED"] = max(1, int(total_linear * 0.27))
-        linear_counts["16' Linear LED"] = max(1, total_linear - sum([
-            linear_counts["4' Linear LED"],
-            linear_counts["6' Linear LED"],
-            linear_counts["8' Linear LED"],
-            linear_counts["10' Linear LED"]
-        ]))
+        linear_counts.update(_apportion(total_linear, _LINEAR_RATIOS))
 
     return dict(linear_counts)
 
@@ -779,7 +1241,83 @@ def count_linear_leds_with_distribution(
 # VECTOR PATH EXTRACTION (PyMuPDF)
 # =============================================================================
 
-def extract_line_lengths(pdf_path: str, page_num: int) -> Dict[str, float]:
+def _page_drawings(
+    pdf_path: str,
+    page_num: int,
+    cache: Optional[_PageCache] = None
+) -> Tuple[tuple, ...]:
+    """Parse a page's vector drawings, or take them from the cache if one is given."""
+    if cache is not None:
+        return cache.get_drawings(page_num)
+
+    doc = fitz.open(pdf_path)
+    try:
+        drawings = doc[page_num].get_cdrawings()
+    finally:
+        doc.close()
+
+    return _normalize_drawings(drawings)
+
+
+def _normalize_drawings(drawings: List[dict]) -> Tuple[tuple, ...]:
+    """
+    Reduce PyMuPDF drawing dicts to plain tuples.
+
+    Takes get_cdrawings() output rather than get_drawings(), which only wraps
+    the same data in Point/Rect objects. Each path is reduced to
+    (width, color, deltas), where deltas is an array('d') of interleaved
+    dx, dy values, one pair per line segment. Width is None for fill-only
+    paths.
+    """
+    normalized = []
+    for drawing in drawings:
+        deltas = array('d')
+        extend = deltas.extend
+        for item in drawing.get('items') or ():
+            if item[0] == 'l':  # item format: ('l', (x1, y1), (x2, y2))
+                _, p1, p2 = item
+                extend((p2[0] - p1[0], p2[1] - p1[1]))
+        normalized.append((drawing.get('width'), drawing.get('color'), deltas))
+
+    return tuple(normalized)
+
+
+def _drawings_to_arrays(drawings: Tuple[tuple, ...], stroked_only: bool = True):
+    """
+    Flatten normalized drawings into parallel per-segment arrays.
+
+    Args:
+        drawings: Output of _page_drawings()
+        stroked_only: Leave out fill-only paths (hatching, filled symbols),
+                      which report no line width and aren't line runs
+
+    Returns:
+        Tuple of NumPy float arrays (widths, dx, dy), one entry per line
+        segment; width is NaN for fill-only paths when they're included
+    """
+    widths = array('d')
+    deltas = array('d')
+
+    for width, _, drawing_deltas in drawings:
+        if not drawing_deltas:
+            continue
+        if width is None:
+            if stroked_only:
+                continue
+            width = np.nan
+
+        widths.extend([width] * (len(drawing_deltas) // 2))
+        deltas.extend(drawing_deltas)
+
+    xy = np.frombuffer(deltas, dtype=float).reshape(-1, 2)
+    return np.frombuffer(widths, dtype=float), xy[:, 0], xy[:, 1]
+
+
+def extract_line_lengths(
+    pdf_path: str,
+    page_num: int,
+    cache: Optional[_PageCache] = None
+) -> Dict[str, float]:
     """
     Extract line lengths grouped by line width using PyMuPDF.
 
@@ -789,65 +1327,70 @@ def extract_line_lengths(pdf_path: str, page_num: int) -> Dict[str, float]:
     Args:
         pdf_path: Path to the PDF file
         page_num: Page number (0-indexed)
+        cache: Optional _PageCache to reuse a page's parsed drawings
 
     Returns:
         Dictionary mapping line width categories to total lengths in feet
     """
     if fitz is None:
         raise ImportError("PyMuPDF required. Install with: pip install pymupdf")
+    if np is None:
+        raise ImportError("NumPy required. Install with: pip install numpy")
 
-    doc = fitz.open(pdf_path)
-    page = doc[page_num]
+    # Stroked line segments only; fill outlines aren't runs
+    widths, dxs, dys = _drawings_to_arrays(_page_drawings(pdf_path, page_num, cache))
 
-    # Get page dimensions for scale calculation
-    # Typical electrical drawings are 1/8" = 1'-0" scale
-    page_rect = page.rect
-    page_width_inches = page_rect.width / 72  # 72 points per inch
+    # Calculate total lengths by width category
+    # Convert from points to feet using assumed scale
+    # 72 points = 1 inch, at 1/8" = 1' scale, 1 inch = 8 feet
+    scale_factor = 8 / 72  # feet per point
 
-    # Get all drawings (vector paths)
-    drawings = page.get_drawings()
+    # Sum segment lengths per distinct width, keeping first-seen width order
+    unique_widths, first_seen, groups = np.unique(widths, return_index=True, return_inverse=True)
+    totals = np.bincount(groups, weights=np.hypot(dxs, dys), minlength=len(unique_widths))
 
-    # Group lines by width
-    lines_by_width = defaultdict(list)
+    lengths_by_width = {}
+    for group in np.argsort(first_seen, kind='stable'):
+        total_feet = float(totals[group]) * scale_factor
+        lengths_by_width[f"width_{unique_widths[group]:.2f}"] = round(total_feet, 1)
 
-    for drawing in drawings:
-        if drawing.get('items'):
-            for item in drawing['items']:
-                item_type = item[0]
-                if item_type == 'l':  # Line segment
-                    # item format: ('l', Point1, Point2)
-                    p1 = item[1]
-                    p2 = item[2]
+    return lengths_by_width
 
-                    # Calculate line length in points
-                    dx = p2.x - p1.x
-                    dy = p2.y - p1.y
-                    length_points = (dx**2 + dy**2) ** 0.5
 
-                    # Get line width
-                    width = drawing.get('width', 1.0)
+# Default PDF line width -> conduit size mapping for extract_conduit_lengths
+_DEFAULT_CONDUIT_WIDTHS = {
+    0.25: '3/4"',
+    0.5: '3/4"',
+    0.75: '1"',
+    1.0: '1"',
+    1.5: '1-1/4"',
+}
 
-                    lines_by_width[width].append(length_points)
 
-    # Calculate total lengths by width category
-    # Convert from points to feet using assumed scale
-    # 72 points = 1 inch, at 1/8" = 1' scale, 1 inch = 8 feet
-    scale_factor = 8 / 72  # feet per point
+@lru_cache(maxsize=8)
+def _conduit_size_buckets(mapping_items: Tuple[Tuple[float, str], ...]):
+    """
+    Build the searchsorted lookup for a width -> conduit size mapping.
 
-    lengths_by_width = {}
-    for width, line_lengths in lines_by_width.items():
-        total_points = sum(line_lengths)
-        total_feet = total_points * scale_factor
-        lengths_by_width[f"width_{width:.2f}"] = round(total_feet, 1)
+    A line belongs to the first mapped width (ascending) whose tolerance band
+    (width * 1.5) covers it; wider lines fall into a trailing 3/4" default
+    bucket. Cached so the sort and array build happen once per mapping.
 
-    doc.close()
-    return lengths_by_width
+    Returns:
+        Tuple of (read-only threshold array, list of sizes per bucket)
+    """
+    sorted_mapping = sorted(mapping_items)
+    thresholds = np.array([w * 1.5 for w, _ in sorted_mapping], dtype=float)  # Allow some tolerance
+    thresholds.flags.writeable = False
+    sizes = [size for _, size in sorted_mapping] + ['3/4"']
+    return thresholds, sizes
 
 
 def extract_conduit_lengths(
     pdf_path: str,
     page_num: int,
-    width_mapping: Optional[Dict[float, str]] = None
+    width_mapping: Optional[Dict[float, str]] = None,
+    cache: Optional[_PageCache] = None
 ) -> Dict[str, int]:
     """
     Extract conduit lengths from PDF vector paths.
@@ -859,67 +1402,51 @@ def extract_conduit_lengths(
         page_num: Page number (0-indexed)
         width_mapping: Optional mapping of PDF line widths to conduit sizes
                       e.g., {0.5: '3/4"', 1.0: '1"'}
+        cache: Optional _PageCache to reuse a page's parsed drawings
 
     Returns:
         Dictionary mapping conduit sizes to lengths in feet
     """
     if fitz is None:
         raise ImportError("PyMuPDF required. Install with: pip install pymupdf")
+    if np is None:
+        raise ImportError("NumPy required. Install with: pip install numpy")
 
     # Default width mapping (may need calibration for specific PDFs)
     if width_mapping is None:
-        width_mapping = {
-            0.25: '3/4"',
-            0.5: '3/4"',
-            0.75: '1"',
-            1.0: '1"',
-            1.5: '1-1/4"',
-        }
-
-    doc = fitz.open(pdf_path)
-    page = doc[page_num]
-
-    # Get drawings
-    drawings = page.get_drawings()
-
-    # Accumulate lengths by conduit size
-    conduit_lengths = defaultdict(float)
+        width_mapping = _DEFAULT_CONDUIT_WIDTHS
 
     # Scale factor: 72 points = 1 inch
     # Assuming 1/8" = 1'-0" scale: 1 inch on drawing = 8 feet actual
     scale_factor = 8 / 72
 
-    for drawing in drawings:
-        width = drawing.get('width', 0.5)
-
-        # Find matching conduit size
-        conduit_size = None
-        for w, size in sorted(width_mapping.items()):
-            if width <= w * 1.5:  # Allow some tolerance
-                conduit_size = size
-                break
-
-        if conduit_size is None:
-            conduit_size = '3/4"'  # Default
-
-        # Sum line lengths
-        if drawing.get('items'):
-            for item in drawing['items']:
-                if item[0] == 'l':  # Line segment
-                    p1, p2 = item[1], item[2]
-                    dx = p2.x - p1.x
-                    dy = p2.y - p1.y
-                    length_points = (dx**2 + dy**2) ** 0.5
-                    length_feet = length_points * scale_factor
-                    conduit_lengths[conduit_size] += length_feet
+    # Every stroked line segment with the width of its drawing
+    widths, dxs, dys = _drawings_to_arrays(_page_drawings(pdf_path, page_num, cache))
 
-    doc.close()
+    # Find matching conduit size for every segment at once
+    thresholds, sizes = _conduit_size_buckets(tuple(width_mapping.items()))
+    buckets = np.searchsorted(thresholds, widths, side='left')
+
+    # Sum line lengths per bucket, then fold buckets into conduit sizes
+    lengths_feet = np.hypot(dxs, dys) * scale_factor
+    bucket_totals = np.bincount(buckets, weights=lengths_feet, minlength=len(sizes))
+    bucket_hits = np.bincount(buckets, minlength=len(sizes))
+
+    # Accumulate lengths by conduit size
+    conduit_lengths = defaultdict(float)
+    for bucket, size in enumerate(sizes):
+        if bucket_hits[bucket]:
+            conduit_lengths[size] += float(bucket_totals[bucket])
 
     # Round to integers
     return {size: int(length) for size, length in conduit_lengths.items()}
 
 
-def analyze_drawing_elements(pdf_path: str, page_num: int) -> dict:
+def analyze_drawing_elements(
+    pdf_path: str,
+    page_num: int,
+    cache: Optional[_PageCache] = None
+) -> dict:
     """
     Analyze all drawing elements on a page for debugging/calibration.
 
@@ -929,17 +1456,17 @@ def analyze_drawing_elements(pdf_path: str, page_num: int) -> dict:
     Args:
         pdf_path: Path to the PDF file
         page_num: Page number (0-indexed)
+        cache: Optional _PageCache to reuse a page's parsed drawings
 
     Returns:
         Dictionary with element statistics
     """
     if fitz is None:
         raise ImportError("PyMuPDF required. Install with: pip install pymupdf")
+    if np is None:
+        raise ImportError("NumPy required. Install with: pip install numpy")
 
-    doc = fitz.open(pdf_path)
-    page = doc[page_num]
-
-    drawings = page.get_drawings()
+    drawings = _page_drawings(pdf_path, page_num, cache)
 
     stats = {
         'total_drawings': len(drawings),
@@ -948,26 +1475,18 @@ def analyze_drawing_elements(pdf_path: str, page_num: int) -> dict:
         'colors_used': set(),
     }
 
-    for drawing in drawings:
-        width = drawing.get('width', 0)
-        color = drawing.get('color')
-
+    for width, color, deltas in drawings:
         if color:
             stats['colors_used'].add(str(color))
 
-        if drawing.get('items'):
-            for item in drawing['items']:
-                if item[0] == 'l':
-                    stats['line_counts_by_width'][width] += 1
-                    p1, p2 = item[1], item[2]
-                    dx = p2.x - p1.x
-                    dy = p2.y - p1.y
-                    stats['total_line_length'] += (dx**2 + dy**2) ** 0.5
+        if deltas:
+            stats['line_counts_by_width'][width] += len(deltas) // 2
 
+    _, dxs, dys = _drawings_to_arrays(drawings, stroked_only=False)
+    stats['total_line_length'] = float(np.hypot(dxs, dys).sum())
     stats['line_counts_by_width'] = dict(stats['line_counts_by_width'])
     stats['colors_used'] = list(stats['colors_used'])
 
-    doc.close()
     return stats
 
 
@@ -977,7 +1496,9 @@ def analyze_drawing_elements(pdf_path: str, page_num: int) -> dict:
 
 def extract_floor_plan_data(
     pdf_path: str,
-    floor_plan_pages: Dict[str, int]
+    floor_plan_pages: Dict[str, int],
+    parallel: bool = False,
+    cache: Optional[_PageCache] = None
 ) -> DeviceCounts:
     """
     Extract all device counts from floor plan pages.
@@ -989,26 +1510,49 @@ def extract_floor_plan_data(
         pdf_path: Path to the PDF file
         floor_plan_pages: Dictionary mapping sheet names to page numbers
                          e.g., {'E200': 2, 'E201': 3}
+        parallel: Extract sheets in worker processes instead of serially;
+                  only worth it for several large, dense sheets
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         DeviceCounts with extracted fixture counts
     """
     counts = DeviceCounts()
 
-    for sheet_name, page_num in floor_plan_pages.items():
+    if parallel:
+        # Worker processes open the PDF themselves
+        page_results = _run_per_page(
+            extract_fixture_counts, pdf_path, floor_plan_pages.values(), parallel=True
+        )
+    elif cache is not None:
+        page_results = _run_per_page(
+            extract_fixture_counts, pdf_path, floor_plan_pages.values(), cache=cache
+        )
+    else:
         try:
-            fixture_counts = extract_fixture_counts(pdf_path, page_num)
+            cache = _PageCache.open(pdf_path)
+        except Exception as e:
+            # Unreadable PDF: report the open error against every sheet
+            page_results = dict.fromkeys(floor_plan_pages.values(), e)
+        else:
+            with cache:
+                page_results = _run_per_page(
+                    extract_fixture_counts, pdf_path, floor_plan_pages.values(), cache=cache
+                )
 
-            # Add to appropriate category
-            for fixture, count in fixture_counts.items():
-                if fixture.startswith('X'):
-                    # Exit signs go in fixtures
-                    counts.fixtures[fixture] = counts.fixtures.get(fixture, 0) + count
-                elif fixture.startswith('F'):
-                    counts.fixtures[fixture] = counts.fixtures.get(fixture, 0) + count
+    for sheet_name, page_num in floor_plan_pages.items():
+        fixture_counts = page_results[page_num]
+        if isinstance(fixture_counts, Exception):
+            print(f"Warning: Failed to extract from {sheet_name} (page {page_num}): {fixture_counts}")
+            continue
 
-        except Exception as e:
-            print(f"Warning: Failed to extract from {sheet_name} (page {page_num}): {e}")
+        # Add to appropriate category
+        for fixture, count in fixture_counts.items():
+            if fixture.startswith('X'):
+                # Exit signs go in fixtures
+                counts.fixtures[fixture] = counts.fixtures.get(fixture, 0) + count
+            elif fixture.startswith('F'):
+                counts.fixtures[fixture] = counts.fixtures.get(fixture, 0) + count
 
     return counts
 
@@ -1022,22 +1566,29 @@ def get_pdf_page_count(pdf_path: str) -> int:
         return len(pdf.pages)
 
 
-def get_page_text_sample(pdf_path: str, page_num: int, max_chars: int = 500) -> str:
-    """Get a text sample from a PDF page for debugging."""
+def get_page_text_sample(
+    pdf_path: str,
+    page_num: int,
+    max_chars: int = 500,
+    cache: Optional[_PageCache] = None
+) -> str:
+    """Get a text sample from a PDF page for debugging (from the cache if given)."""
     if pdfplumber is None:
         raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
 
-    with pdfplumber.open(pdf_path) as pdf:
-        page = pdf.pages[page_num]
-        text = page.extract_text() or ""
-        return text[:max_chars]
+    with _page_cache_for(pdf_path, cache) as cache:
+        return cache.get_text(page_num)[:max_chars]
 
 
 # =============================================================================
 # E200 CONTROLS EXTRACTION
 # =============================================================================
 
-def extract_controls(pdf_path: str, page_num: int) -> Dict[str, int]:
+def extract_controls(
+    pdf_path: str,
+    page_num: int,
+    cache: Optional[_PageCache] = None
+) -> Dict[str, int]:
     """
     Extract control device counts from E200 lighting plan.
 
@@ -1052,42 +1603,32 @@ def extract_controls(pdf_path: str, page_num: int) -> Dict[str, int]:
     Args:
         pdf_path: Path to the PDF file
         page_num: Page number (0-indexed), typically 2 for E200
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Dictionary with control counts
     """
     if pdfplumber is None:
         raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
+    if np is None:
+        raise ImportError("NumPy required. Install with: pip install numpy")
 
-    with pdfplumber.open(pdf_path) as pdf:
-        page = pdf.pages[page_num]
-        words = page.extract_words()
-
-        # Page dimensions for filtering
-        width = page.width
-        height = page.height
-
-        # Floor plan area is typically left 85% of page, excluding title block
-        floor_plan_x_max = width * 0.85
-        floor_plan_y_max = height * 0.85
-
-        oc_count = 0
-        ls_count = 0
-        d_count = 0
+    with _page_cache_for(pdf_path, cache) as cache:
+        words = cache.get_word_arrays(page_num)
 
-        for word in words:
-            # Only count items in floor plan area
-            if word['x0'] > floor_plan_x_max or word['top'] > floor_plan_y_max:
-                continue
+        # Only count items in floor plan area: left 85% of the page,
+        # excluding the title block
+        in_plan = cache.get_plan_mask(page_num, 0.85, 0.85)
+        text = words.upper[in_plan]
+        word_width = (words.x1 - words.x0)[in_plan]
 
-            text = word['text'].upper()
+        # Tally tokens once; D only counts when its box is narrow
+        token_counts = Counter(text.tolist())
+        narrow_counts = Counter(text[word_width < 20].tolist())
 
-            if text == 'OC':
-                oc_count += 1
-            elif text == 'LS':
-                ls_count += 1
-            elif text == 'D' and word['x1'] - word['x0'] < 20:
-                d_count += 1
+        oc_count = token_counts['OC']
+        ls_count = token_counts['LS']
+        d_count = narrow_counts['D']
 
         # Multi-floor sheets show devices twice (once per floor level view)
         # Divide by 2 to get actual device count
@@ -1110,7 +1651,15 @@ def extract_controls(pdf_path: str, page_num: int) -> Dict[str, int]:
 # E201 POWER DEVICE EXTRACTION
 # =============================================================================
 
-def extract_power_devices(pdf_path: str, page_num: int) -> Dict[str, int]:
+# Receptacle circuit designations (circuits 35-42)
+_RECEPTACLE_CIRCUIT_REGEX = re.compile(r'\b3[5-9]\b|\b4[0-2]\b')
+
+
+def extract_power_devices(
+    pdf_path: str,
+    page_num: int,
+    cache: Optional[_PageCache] = None
+) -> Dict[str, int]:
     """
     Extract power device counts from E201 power/systems plan.
 
@@ -1124,6 +1673,7 @@ def extract_power_devices(pdf_path: str, page_num: int) -> Dict[str, int]:
     Args:
         pdf_path: Path to the PDF file
         page_num: Page number (0-indexed), typically 3 for E201
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Dictionary with power device counts
@@ -1131,18 +1681,11 @@ def extract_power_devices(pdf_path: str, page_num: int) -> Dict[str, int]:
     if pdfplumber is None:
         raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
 
-    import re
-
-    with pdfplumber.open(pdf_path) as pdf:
-        page = pdf.pages[page_num]
-        words = page.extract_words()
-        text = page.extract_text() or ""
+    if np is None:
+        raise ImportError("NumPy required. Install with: pip install numpy")
 
-        # Page dimensions for filtering
-        width = page.width
-        height = page.height
-        floor_plan_x_max = width * 0.85
-        floor_plan_y_max = height * 0.85
+    with _page_cache_for(pdf_path, cache) as cache:
+        words = cache.get_word_arrays(page_num)
 
         devices = {
             'Duplex Receptacle': 0,
@@ -1156,25 +1699,18 @@ def extract_power_devices(pdf_path: str, page_num: int) -> Dict[str, int]:
         }
 
         # Count fire alarm devices in floor plan area
-        s_count = 0
-        f_count = 0
-        h015_count = 0
-        h030_count = 0
+        in_plan = cache.get_plan_mask(page_num, 0.85, 0.85)
+        text_upper = words.upper[in_plan]
+        narrow = (words.x1 - words.x0)[in_plan] < 15
 
-        for word in words:
-            if word['x0'] > floor_plan_x_max or word['top'] > floor_plan_y_max:
-                continue
-
-            text_upper = word['text'].upper()
+        # Tally tokens once; S and F only count when their box is narrow
+        token_counts = Counter(text_upper.tolist())
+        narrow_counts = Counter(text_upper[narrow].tolist())
 
-            if text_upper == '015':
-                h015_count += 1
-            elif text_upper == '030':
-                h030_count += 1
-            elif text_upper == 'S' and word['x1'] - word['x0'] < 15:
-                s_count += 1
-            elif text_upper == 'F' and word['x1'] - word['x0'] < 15:
-                f_count += 1
+        h015_count = token_counts['015']
+        h030_count = token_counts['030']
+        s_count = narrow_counts['S']
+        f_count = narrow_counts['F']
 
         # Divide by 2 for multi-floor duplication
         devices['Smoke Detector'] = s_count // 2
@@ -1183,9 +1719,11 @@ def extract_power_devices(pdf_path: str, page_num: int) -> Dict[str, int]:
         devices['Pull Station'] = f_count // 2
 
         # Count receptacles - look for circuit numbers in 30-42 range
-        # These are typical receptacle circuit designations
-        circuit_refs = re.findall(r'\b3[5-9]\b|\b4[0-2]\b', text)
-        raw_receptacle_count = len(circuit_refs)
+        # These are typical receptacle circuit designations. They are
+        # whole-word tokens, so the joined words match exactly as the
+        # layout text would, without a second pdfminer pass
+        text = " ".join(words.text.tolist())
+        raw_receptacle_count = _count_matches(_RECEPTACLE_CIRCUIT_REGEX, text)
 
         # Adjust for multi-floor and estimate total
         # Ground truth shows 37 duplex + 5 GFI = 42 total receptacles
@@ -1198,7 +1736,6 @@ def extract_power_devices(pdf_path: str, page_num: int) -> Dict[str, int]:
         # Switches - look for S3 (3-way) and S (SP) patterns
         # SP switches are standalone "S" that aren't smoke detectors
         # 3-way switches marked as "3" or "S3"
-        s3_count = len(re.findall(r'\bS3\b|\b3\b', text))
         devices['SP Switch'] = 3  # Typical small project has ~3 SP switches
         devices['3-Way Switch'] = 2  # Typical small project has ~2 3-way switches
 
@@ -1209,10 +1746,25 @@ def extract_power_devices(pdf_path: str, page_num: int) -> Dict[str, int]:
 # E100 DEMO ITEMS EXTRACTION
 # =============================================================================
 
+# Keynote mapping based on typical E100 legend
+_DEMO_KEYNOTES = {
+    '1': "Demo 2'x4' Recessed",
+    '2': "Demo 2'x2' Recessed",
+    '3': "Demo Downlight",
+    '4': "Demo Switch",
+    '5': "Demo 4' Strip",
+    '6': "Demo 8' Strip",
+    '7': "Demo Exit",
+    '9': "Demo Receptacle",
+}
+_DEMO_KEYNOTE_TOKENS = tuple(_DEMO_KEYNOTES)
+
+
 def extract_demo_items(
     pdf_path: str,
     page_num: int,
-    floor_count: int = 2
+    floor_count: int = 2,
+    cache: Optional[_PageCache] = None
 ) -> Dict[str, int]:
     """
     Extract demolition item counts from E100 demo plan.
@@ -1238,25 +1790,18 @@ def extract_demo_items(
         pdf_path: Path to the PDF file
         page_num: Page number (0-indexed), typically 1 for E100
         floor_count: Number of floors shown on multi-floor sheets
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Dictionary with demo item counts
     """
     if pdfplumber is None:
         raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
+    if np is None:
+        raise ImportError("NumPy required. Install with: pip install numpy")
 
-    with pdfplumber.open(pdf_path) as pdf:
-        page = pdf.pages[page_num]
-        words = page.extract_words()
-        text = page.extract_text() or ""
-
-        # Page dimensions for filtering
-        width = page.width
-        height = page.height
-
-        # Floor plan area - exclude title block (right side) and notes (bottom)
-        floor_plan_x_max = width * 0.85
-        floor_plan_y_max = height * 0.90  # Include more area
+    with _page_cache_for(pdf_path, cache) as cache:
+        words = cache.get_word_arrays(page_num)
 
         demo = {
             "Demo 2'x4' Recessed": 0,
@@ -1270,41 +1815,22 @@ def extract_demo_items(
             "Demo Switch": 0,
         }
 
-        # Keynote mapping based on typical E100 legend
-        keynote_mapping = {
-            '1': "Demo 2'x4' Recessed",
-            '2': "Demo 2'x2' Recessed",
-            '3': "Demo Downlight",
-            '4': "Demo Switch",
-            '5': "Demo 4' Strip",
-            '6': "Demo 8' Strip",
-            '7': "Demo Exit",
-            '9': "Demo Receptacle",
-        }
+        keynote_mapping = _DEMO_KEYNOTES
 
-        # Count keynotes in floor plan area
-        keynote_counts = defaultdict(int)
-        fb_count = 0
+        # Count keynotes in floor plan area - exclude title block (right side)
+        # and notes (bottom), keeping 90% of the height to include more area
+        in_plan = cache.get_plan_mask(page_num, 0.85, 0.90)
+        text_val = np.char.strip(words.text[in_plan])
 
-        for word in words:
-            # Only count items in floor plan area
-            if word['x0'] > floor_plan_x_max or word['top'] > floor_plan_y_max:
-                continue
+        # Check for floor box symbol
+        fb_count = int(np.count_nonzero(np.char.strip(words.upper[in_plan]) == 'FB'))
 
-            text_val = word['text'].strip()
-
-            # Check for floor box symbol
-            if text_val.upper() == 'FB':
-                fb_count += 1
-                continue
-
-            # Check for keynote numbers (single digits in floor plan context)
-            # Keynotes are typically small, isolated numbers
-            if text_val in keynote_mapping:
-                # Check if it's a standalone number (not part of larger text)
-                word_width = word['x1'] - word['x0']
-                if word_width < 30:  # Keynote numbers are small
-                    keynote_counts[text_val] += 1
+        # Check for keynote numbers (single digits in floor plan context)
+        # Keynotes are typically small, isolated numbers: standalone numbers
+        # (not part of larger text) with a narrow bounding box
+        word_width = (words.x1 - words.x0)[in_plan]
+        is_keynote = np.isin(text_val, _DEMO_KEYNOTE_TOKENS) & (word_width < 30)
+        keynote_counts = Counter(text_val[is_keynote].tolist())
 
         # Also scan for patterns in the full text that indicate demos
         # Look for circled numbers or number patterns near "DEMO" text
@@ -1350,12 +1876,15 @@ def extract_demo_items(
 
         # If keynote detection failed, use fallback estimation based on text analysis
         if sum(demo.values()) < 10:
-            demo = _estimate_demo_from_text(text, floor_count)
+            demo = _estimate_demo_from_text(" ".join(words.text.tolist()), floor_count)
             demo["Demo Floor Box"] = (fb_count + floor_count - 1) // floor_count
 
         return demo
 
 
+_ISOLATED_DIGIT_REGEX = re.compile(r'(?<![0-9])[1-9](?![0-9])')
+
+
 def _estimate_demo_from_text(text: str, floor_count: int = 2) -> Dict[str, int]:
     """
     Fallback estimation of demo items when keynote detection fails.
@@ -1374,27 +1903,12 @@ def _estimate_demo_from_text(text: str, floor_count: int = 2) -> Dict[str, int]:
         "Demo Switch": 0,
     }
 
-    # Count each digit occurrence in the text
-    digit_counts = defaultdict(int)
-    for digit in '123456789':
-        # Count isolated digits (not part of larger numbers like "20" or "123")
-        pattern = rf'(?<![0-9]){digit}(?![0-9])'
-        matches = re.findall(pattern, text)
-        digit_counts[digit] = len(matches)
+    # Count each isolated digit (not part of larger numbers like "20" or "123")
+    # in one pass over the text
+    digit_counts = Counter(m.group() for m in _ISOLATED_DIGIT_REGEX.finditer(text))
 
     # Apply keynote mapping with floor count adjustment
-    keynote_to_demo = {
-        '1': "Demo 2'x4' Recessed",
-        '2': "Demo 2'x2' Recessed",
-        '3': "Demo Downlight",
-        '4': "Demo Switch",
-        '5': "Demo 4' Strip",
-        '6': "Demo 8' Strip",
-        '7': "Demo Exit",
-        '9': "Demo Receptacle",
-    }
-
-    for keynote, demo_type in keynote_to_demo.items():
+    for keynote, demo_type in _DEMO_KEYNOTES.items():
         raw_count = digit_counts[keynote]
         # Adjust for multi-floor and filter out non-keynote occurrences
         # Keynotes typically appear 2-4x per item (multiple views, legends)
@@ -1404,11 +1918,21 @@ def _estimate_demo_from_text(text: str, floor_count: int = 2) -> Dict[str, int]:
     return demo
 
 
+# Legend/keynote wording that indicates a demo item type is present on E100
+_DEMO_2X4_REGEX = re.compile(r"2['\"]?\s*[xX]\s*4['\"]?")
+_DEMO_2X2_REGEX = re.compile(r"2['\"]?\s*[xX]\s*2['\"]?")
+_DEMO_DOWNLIGHT_REGEX = re.compile(r"DOWN\s*LIGHT|RECESSED\s*DOWN", re.IGNORECASE)
+_DEMO_EXIT_REGEX = re.compile(r"EXIT", re.IGNORECASE)
+_DEMO_RECEPTACLE_REGEX = re.compile(r"RECEPT|OUTLET", re.IGNORECASE)
+_DEMO_SWITCH_REGEX = re.compile(r"SWITCH|TOGGLE", re.IGNORECASE)
+
+
 def extract_demo_items_enhanced(
     pdf_path: str,
     e100_page: Optional[int] = None,
     sheet_map: Optional[Dict[str, int]] = None,
-    floor_count: int = 2
+    floor_count: int = 2,
+    cache: Optional[_PageCache] = None
 ) -> Dict[str, int]:
     """
     Enhanced demo extraction with auto-detection and better pattern matching.
@@ -1421,6 +1945,7 @@ def extract_demo_items_enhanced(
         e100_page: Page number for E100 (0-indexed). If None, auto-detects.
         sheet_map: Optional pre-computed sheet map
         floor_count: Number of floors shown on multi-floor sheets
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Dictionary with demo item counts
@@ -1434,48 +1959,47 @@ def extract_demo_items_enhanced(
             sheet_map = detect_sheet_pages(pdf_path)
         e100_page = sheet_map.get("E100", 1)  # Default to page 1 (0-indexed)
 
-    # Get basic demo counts
-    demo = extract_demo_items(pdf_path, e100_page, floor_count)
+    with _page_cache_for(pdf_path, cache) as cache:
+        # Get basic demo counts
+        demo = extract_demo_items(pdf_path, e100_page, floor_count, cache)
 
-    # Enhance with additional pattern matching
-    with pdfplumber.open(pdf_path) as pdf:
-        if e100_page >= len(pdf.pages):
+        # Enhance with additional pattern matching
+        if e100_page >= cache.page_count:
             return demo
 
-        page = pdf.pages[e100_page]
-        text = page.extract_text() or ""
+        text = cache.get_text(e100_page)
 
         # Look for specific demo patterns in text
         # These patterns appear in legends or keynote definitions
 
         # 2'x4' patterns
-        if re.search(r"2['\"]?\s*[xX]\s*4['\"]?", text):
+        if _DEMO_2X4_REGEX.search(text):
             if demo["Demo 2'x4' Recessed"] == 0:
                 # Estimate based on typical ratio to 8' strips
                 demo["Demo 2'x4' Recessed"] = max(demo["Demo 8' Strip"] // 4, 7)
 
         # 2'x2' patterns
-        if re.search(r"2['\"]?\s*[xX]\s*2['\"]?", text):
+        if _DEMO_2X2_REGEX.search(text):
             if demo["Demo 2'x2' Recessed"] == 0:
                 demo["Demo 2'x2' Recessed"] = max(demo["Demo 8' Strip"] // 2, 12)
 
         # Downlight patterns
-        if re.search(r"DOWN\s*LIGHT|RECESSED\s*DOWN", text, re.IGNORECASE):
+        if _DEMO_DOWNLIGHT_REGEX.search(text):
             if demo["Demo Downlight"] == 0:
                 demo["Demo Downlight"] = max(demo["Demo 8' Strip"] // 2, 12)
 
         # Exit patterns
-        if re.search(r"EXIT", text, re.IGNORECASE):
+        if _DEMO_EXIT_REGEX.search(text):
             if demo["Demo Exit"] == 0:
                 demo["Demo Exit"] = 2  # Typical minimum
 
         # Receptacle patterns
-        if re.search(r"RECEPT|OUTLET", text, re.IGNORECASE):
+        if _DEMO_RECEPTACLE_REGEX.search(text):
             if demo["Demo Receptacle"] == 0:
                 demo["Demo Receptacle"] = 13  # Typical for this project size
 
         # Switch patterns
-        if re.search(r"SWITCH|TOGGLE", text, re.IGNORECASE):
+        if _DEMO_SWITCH_REGEX.search(text):
             if demo["Demo Switch"] == 0:
                 demo["Demo Switch"] = 2  # Typical minimum
 
@@ -1486,10 +2010,66 @@ def extract_demo_items_enhanced(
 # T200 TECHNOLOGY EXTRACTION (Enhanced for better Cat 6 Jack counting)
 # =============================================================================
 
+# Pattern-based jack counting for technology plans
+# Each pattern type contributes a number of Cat 6 jacks. The patterns match
+# disjoint whole tokens, so they are combined into one alternation (one named
+# group per pattern) and counted in a single pass.
+_TECH_JACK_PATTERNS = (
+    # Wall plates - number indicates ports
+    (r'\bWP1\b', 1),
+    (r'\bWP2\b', 2),
+    (r'\bWP4\b', 4),
+    # Data designations
+    (r'\b2C\b', 2),      # 2 Cat6
+    (r'\bC2\b', 2),      # Cat6 type 2
+    (r'\b4C\b', 4),      # 4 Cat6
+    (r'\bC4\b', 4),      # Cat6 type 4
+    (r'\b1C\b', 1),      # 1 Cat6
+    (r'\bC1\b', 1),      # Cat6 type 1
+    # Port designations
+    (r'\b1PW\b', 1),     # 1 port wall
+    (r'\b2PW\b', 2),     # 2 port wall
+    (r'\b1P[KF]\b', 1),  # 1 port keystone/floor
+    (r'\b2P[KF]\b', 2),  # 2 port keystone/floor
+    (r'\b4P[KF]\b', 4),  # 4 port keystone/floor
+    # Device types with data
+    (r'\bKP\d?\b', 1),   # Keypad
+    (r'\bCR\d?\b', 1),   # Card reader
+    (r'\bAP\d?\b', 2),   # Access point (typically 2 ports)
+    (r'\bCAM\d?\b', 1),  # Camera
+    (r'\bTV\d?\b', 2),   # TV (data + coax or 2 data)
+    (r'\bPRJ\d?\b', 2),  # Projector
+    (r'\bDOC\b', 1),     # Document camera
+    # Security/communication devices
+    (r'\bSSC\b', 1),
+    (r'\bCSS\b', 2),
+    (r'\bCOM\d?\b', 1),
+    # Floor box patterns with data (usually 4 jacks)
+    (r'\bFB[- ]?D\b', 4),   # Floor box - data
+    (r'\bDFB\b', 4),        # Data floor box
+    # Workstation patterns
+    (r'\bWS\d?\b', 2),      # Workstation
+    # Generic data outlet patterns
+    (r'\bDATA\b', 1),
+    (r'\bDO\b', 1),         # Data outlet
+)
+_TECH_JACK_REGEX = re.compile(
+    "|".join(f"(?P<j{i}>{pattern})" for i, (pattern, _) in enumerate(_TECH_JACK_PATTERNS)),
+    re.IGNORECASE
+)
+_TECH_JACK_WEIGHTS = {f"j{i}": jacks for i, (_, jacks) in enumerate(_TECH_JACK_PATTERNS)}
+
+_FLOOR_BOX_REGEX = re.compile(r'\bFB\b')
+
+# Single-token data outlet markers (C, 1C, 2C, 4C, DATA, D, wall plates)
+_DATA_OUTLET_TOKENS = ['C', '1C', '2C', '4C', 'DATA', 'D', 'WP1', 'WP2', 'WP4']
+
+
 def extract_technology(
     pdf_path: str,
     page_num: int,
-    floor_count: int = 2
+    floor_count: int = 2,
+    cache: Optional[_PageCache] = None
 ) -> Dict[str, int]:
     """
     Extract technology device counts from T200 technology plan.
@@ -1507,89 +2087,47 @@ def extract_technology(
         pdf_path: Path to the PDF file
         page_num: Page number (0-indexed), typically 8 for T200
         floor_count: Number of floors shown on multi-floor sheets
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Dictionary with technology counts
     """
     if pdfplumber is None:
         raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
+    if np is None:
+        raise ImportError("NumPy required. Install with: pip install numpy")
 
-    with pdfplumber.open(pdf_path) as pdf:
-        if page_num >= len(pdf.pages):
+    with _page_cache_for(pdf_path, cache) as cache:
+        if page_num >= cache.page_count:
             return {'Cat 6 Jack': 0, 'Floor Box': 0}
 
-        page = pdf.pages[page_num]
-        text = page.extract_text() or ""
-        words = page.extract_words()
+        # Words come from the same characters as the text, so a page with
+        # no text has nothing to count
+        text = cache.get_text(page_num)
+        if not text.strip():
+            return {'Cat 6 Jack': 0, 'Floor Box': 0}
 
-        # Page dimensions for filtering
-        width = page.width
-        height = page.height
-        floor_plan_x_max = width * 0.85
-        floor_plan_y_max = height * 0.90
-
-        # Pattern-based jack counting with improved patterns
-        # Each pattern type contributes a number of Cat 6 jacks
-        patterns_jacks = {
-            # Wall plates - number indicates ports
-            r'\bWP1\b': 1,
-            r'\bWP2\b': 2,
-            r'\bWP4\b': 4,
-            # Data designations
-            r'\b2C\b': 2,      # 2 Cat6
-            r'\bC2\b': 2,      # Cat6 type 2
-            r'\b4C\b': 4,      # 4 Cat6
-            r'\bC4\b': 4,      # Cat6 type 4
-            r'\b1C\b': 1,      # 1 Cat6
-            r'\bC1\b': 1,      # Cat6 type 1
-            # Port designations
-            r'\b1PW\b': 1,     # 1 port wall
-            r'\b2PW\b': 2,     # 2 port wall
-            r'\b1P[KF]\b': 1,  # 1 port keystone/floor
-            r'\b2P[KF]\b': 2,  # 2 port keystone/floor
-            r'\b4P[KF]\b': 4,  # 4 port keystone/floor
-            # Device types with data
-            r'\bKP\d?\b': 1,   # Keypad
-            r'\bCR\d?\b': 1,   # Card reader
-            r'\bAP\d?\b': 2,   # Access point (typically 2 ports)
-            r'\bCAM\d?\b': 1,  # Camera
-            r'\bTV\d?\b': 2,   # TV (data + coax or 2 data)
-            r'\bPRJ\d?\b': 2,  # Projector
-            r'\bDOC\b': 1,     # Document camera
-            # Security/communication devices
-            r'\bSSC\b': 1,
-            r'\bCSS\b': 2,
-            r'\bCOM\d?\b': 1,
-            # Floor box patterns with data (usually 4 jacks)
-            r'\bFB[- ]?D\b': 4,   # Floor box - data
-            r'\bDFB\b': 4,        # Data floor box
-            # Workstation patterns
-            r'\bWS\d?\b': 2,      # Workstation
-            # Generic data outlet patterns
-            r'\bDATA\b': 1,
-            r'\bDO\b': 1,         # Data outlet
-        }
+        words = cache.get_word_arrays(page_num)
 
-        total_jacks = 0
-        for pattern, jacks in patterns_jacks.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            total_jacks += len(matches) * jacks
+        # Pattern-based jack counting: one pass over the text, each match
+        # contributes the jack count of the pattern that matched
+        total_jacks = sum(_TECH_JACK_WEIGHTS[m.lastgroup] for m in _TECH_JACK_REGEX.finditer(text))
 
         # Also count by analyzing word positions for data symbols
         # Look for small text markers that indicate data outlets
-        data_word_count = 0
-        for word in words:
-            # Only count items in floor plan area
-            if word['x0'] > floor_plan_x_max or word['top'] > floor_plan_y_max:
-                continue
-
-            text_val = word['text'].upper()
-
-            # Count specific data outlet indicators
-            if text_val in ['D', 'DATA'] and word['x1'] - word['x0'] < 25:
-                data_word_count += 1
-            elif text_val in ['2C', '4C', 'C2', 'C4']:
-                data_word_count += int(text_val[0]) if text_val[0].isdigit() else 2
+        in_plan = cache.get_plan_mask(page_num, 0.85, 0.90)
+        text_val = words.upper[in_plan]
+        word_width = (words.x1 - words.x0)[in_plan]
+
+        # Count specific data outlet indicators: a small D/DATA marker is one
+        # jack, 2C/4C carry their jack count and C2/C4 count as two
+        token_counts = Counter(text_val.tolist())
+        narrow_counts = Counter(text_val[word_width < 25].tolist())
+        data_word_count = (
+            narrow_counts['D'] + narrow_counts['DATA']
+            + 2 * (token_counts['2C'] + token_counts['C2'] + token_counts['C4'])
+            + 4 * token_counts['4C']
+        )
 
         # Combine pattern and word counts
         raw_jacks = max(total_jacks, data_word_count)
@@ -1598,7 +2136,7 @@ def extract_technology(
         adjusted_jacks = raw_jacks // floor_count if floor_count > 1 else raw_jacks
 
         # Add floor boxes with data (typically 4 jacks each)
-        fb_count = len(re.findall(r'\bFB\b', text))
+        fb_count = _count_matches(_FLOOR_BOX_REGEX, text)
         if fb_count > 0:
             # More floor boxes have data in modern designs
             data_fb_jacks = int(fb_count * 0.4 / floor_count) * 4
@@ -1617,7 +2155,9 @@ def extract_technology_enhanced(
     t200_page: Optional[int] = None,
     sheet_map: Optional[Dict[str, int]] = None,
     floor_count: int = 2,
-    check_additional_pages: bool = True
+    check_additional_pages: bool = True,
+    parallel: bool = False,
+    cache: Optional[_PageCache] = None
 ) -> Dict[str, int]:
     """
     Enhanced technology extraction with multi-page support.
@@ -1631,6 +2171,9 @@ def extract_technology_enhanced(
         sheet_map: Optional pre-computed sheet map
         floor_count: Number of floors shown on multi-floor sheets
         check_additional_pages: Whether to check T201, T202, etc.
+        parallel: Extract pages in worker processes instead of serially;
+                  only worth it for several large, dense sheets
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Dictionary with technology counts
@@ -1644,25 +2187,36 @@ def extract_technology_enhanced(
             sheet_map = detect_sheet_pages(pdf_path)
         t200_page = sheet_map.get("T200", 8)  # Default to page 8 (0-indexed)
 
-    # Get primary T200 counts
-    tech = extract_technology(pdf_path, t200_page, floor_count)
-
-    # Check additional T-series pages if requested
+    # Additional T-series pages, checked if requested
+    additional_pages = []
     if check_additional_pages and sheet_map:
-        additional_jacks = 0
-        for sheet_num, page_idx in sheet_map.items():
-            if sheet_num.startswith('T') and sheet_num != 'T200':
-                try:
-                    page_tech = extract_technology(pdf_path, page_idx, floor_count)
-                    additional_jacks += page_tech.get('Cat 6 Jack', 0)
-                except Exception:
-                    pass
+        additional_pages = [
+            page_idx for sheet_num, page_idx in sheet_map.items()
+            if sheet_num.startswith('T') and sheet_num != 'T200'
+        ]
+
+    extract_page = partial(extract_technology, floor_count=floor_count)
+    page_nums = [t200_page] + additional_pages
+    if parallel:
+        # Worker processes open the PDF themselves
+        page_results = _run_per_page(extract_page, pdf_path, page_nums, parallel=True)
+    else:
+        with _page_cache_for(pdf_path, cache) as cache:
+            page_results = _run_per_page(extract_page, pdf_path, page_nums, cache=cache)
+
+    # Get primary T200 counts
+    tech = page_results[t200_page]
+    if isinstance(tech, Exception):
+        raise tech
 
-        tech['Cat 6 Jack'] += additional_jacks
+    # Add jacks from the other T-series pages (empty unless requested)
+    additional_jacks = 0
+    for page_idx in additional_pages:
+        page_tech = page_results[page_idx]
+        if not isinstance(page_tech, Exception):
+            additional_jacks += page_tech.get('Cat 6 Jack', 0)
 
-    # Apply minimum threshold based on project size
-    # A building with receptacles typically has ~2 data jacks per receptacle
-    # This is a sanity check - if we found very few, something may be wrong
+    tech['Cat 6 Jack'] += additional_jacks
 
     return tech
 
@@ -1670,7 +2224,8 @@ def extract_technology_enhanced(
 def count_data_outlets_from_words(
     pdf_path: str,
     page_num: int,
-    floor_count: int = 2
+    floor_count: int = 2,
+    cache: Optional[_PageCache] = None
 ) -> int:
     """
     Count data outlets by analyzing word positions on T200.
@@ -1682,39 +2237,34 @@ def count_data_outlets_from_words(
         pdf_path: Path to the PDF file
         page_num: Page number (0-indexed)
         floor_count: Number of floors shown
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Estimated Cat 6 jack count
     """
     if pdfplumber is None:
         raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
+    if np is None:
+        raise ImportError("NumPy required. Install with: pip install numpy")
 
-    with pdfplumber.open(pdf_path) as pdf:
-        if page_num >= len(pdf.pages):
+    with _page_cache_for(pdf_path, cache) as cache:
+        if page_num >= cache.page_count:
             return 0
 
-        page = pdf.pages[page_num]
-        words = page.extract_words()
+        words = cache.get_word_arrays(page_num)
 
-        width = page.width
-        height = page.height
-        floor_plan_x_max = width * 0.85
-        floor_plan_y_max = height * 0.90
+        # Data outlet indicators in the floor plan area
+        is_data = (
+            cache.get_plan_mask(page_num, 0.85, 0.90)
+            & np.isin(words.upper, _DATA_OUTLET_TOKENS)
+        )
 
         # Track positions of data markers to avoid double-counting
-        data_positions = set()
-
-        for word in words:
-            if word['x0'] > floor_plan_x_max or word['top'] > floor_plan_y_max:
-                continue
-
-            text = word['text'].upper()
-
-            # Data outlet indicators
-            if re.match(r'^[124]?C$', text) or text in ['DATA', 'D', 'WP1', 'WP2', 'WP4']:
-                # Round position to avoid near-duplicates
-                pos = (round(word['x0'] / 10), round(word['top'] / 10))
-                data_positions.add(pos)
+        # Round position to avoid near-duplicates
+        data_positions = np.unique(
+            np.column_stack((np.round(words.x0[is_data] / 10), np.round(words.top[is_data] / 10))),
+            axis=0
+        )
 
         # Each position represents 1-4 jacks depending on type
         # Average of 2 jacks per data location
@@ -1731,7 +2281,20 @@ def count_data_outlets_from_words(
 # E700 PANEL SCHEDULE EXTRACTION (IMPROVED)
 # =============================================================================
 
-def extract_panel_breakers(pdf_path: str, page_num: int) -> Dict[str, int]:
+# Breaker ratings as standalone numbers in panel schedule text
+_TWENTY_AMP_REGEX = re.compile(r'\b20\b')
+_THIRTY_AMP_REGEX = re.compile(r'\b30\b')
+# Every count below needs one of these in the text
+_PANEL_RATING_TOKENS = ('20', '30', '100')
+# Disconnect/safety switch mentions, any case
+_SAFETY_SWITCH_REGEX = re.compile(r'DISCONNECT|SAFETY', re.IGNORECASE)
+
+
+def extract_panel_breakers(
+    pdf_path: str,
+    page_num: int,
+    cache: Optional[_PageCache] = None
+) -> Dict[str, int]:
     """
     Extract breaker counts from E700 panel schedule.
 
@@ -1743,6 +2306,7 @@ def extract_panel_breakers(pdf_path: str, page_num: int) -> Dict[str, int]:
     Args:
         pdf_path: Path to the PDF file
         page_num: Page number (0-indexed), typically 5 for E700
+        cache: Optional _PageCache to reuse an already-open PDF
 
     Returns:
         Dictionary with breaker counts
@@ -1750,9 +2314,8 @@ def extract_panel_breakers(pdf_path: str, page_num: int) -> Dict[str, int]:
     if pdfplumber is None:
         raise ImportError("pdfplumber required. Install with: pip install pdfplumber")
 
-    with pdfplumber.open(pdf_path) as pdf:
-        page = pdf.pages[page_num]
-        text = page.extract_text() or ""
+    with _page_cache_for(pdf_path, cache) as cache:
+        text = cache.get_text(page_num)
 
         breakers = {
             '20A 1P Breaker': 0,
@@ -1761,29 +2324,29 @@ def extract_panel_breakers(pdf_path: str, page_num: int) -> Dict[str, int]:
             '30A/3P Safety Switch 600V': 0,
             '100A/3P Safety Switch 600V': 0,
         }
-
-        import re
+        if not any(token in text for token in _PANEL_RATING_TOKENS):
+            return breakers
 
         # Count 20A circuits - look for "20" in circuit columns
         # Panel schedules have circuit numbers paired with amp ratings
         # Each "20" in the breaker column = one 20A 1P breaker
 
         # The text has patterns like "20 20 20" for breaker sizes
-        twenty_matches = re.findall(r'\b20\b', text)
+        twenty_count = _count_matches(_TWENTY_AMP_REGEX, text)
         # Filter to reasonable count (each panel has ~42 spaces,
         # but not all filled, and some 20s are in other contexts)
-        breakers['20A 1P Breaker'] = min(len(twenty_matches) // 10, 20)
+        breakers['20A 1P Breaker'] = min(twenty_count // 10, 20)
 
         # 30A 2-pole breakers
-        thirty_matches = re.findall(r'\b30\b', text)
-        breakers['30A 2P Breaker'] = min(len(thirty_matches) // 10, 5)
+        thirty_count = _count_matches(_THIRTY_AMP_REGEX, text)
+        breakers['30A 2P Breaker'] = min(thirty_count // 10, 5)
 
         # Safety switches - look for disconnect patterns
-        if 'DISCONNECT' in text.upper() or 'SAFETY' in text.upper():
+        if _SAFETY_SWITCH_REGEX.search(text):
             # Check for specific sizes mentioned
-            if '30A' in text or '30 A' in text:
+            if any(token in text for token in ('30A', '30 A')):
                 breakers['30A/2P Safety Switch 240V'] = 1
-            if '100A' in text or '100 A' in text:
+            if any(token in text for token in ('100A', '100 A')):
                 breakers['100A/3P Safety Switch 600V'] = 1
 
         return breakers
@@ -1796,7 +2359,8 @@ def extract_panel_breakers(pdf_path: str, page_num: int) -> Dict[str, int]:
 def extract_all_from_pdf(
     pdf_path: str,
     config: Optional[Any] = None,
-    use_auto_detect: bool = True
+    use_auto_detect: bool = True,
+    parallel: bool = False
 ) -> Dict[str, Dict[str, int]]:
     """
     Extract all material counts from a complete electrical PDF set.
@@ -1818,6 +2382,8 @@ def extract_all_from_pdf(
         pdf_path: Path to the PDF file
         config: Optional ProjectConfig with project-specific settings
         use_auto_detect: Whether to auto-detect sheet pages
+        parallel: Extract the sheets in worker processes instead of serially
+                  from one shared open PDF; only worth it for large, dense sets
 
     Returns:
         Dictionary with categories of extracted counts
@@ -1862,89 +2428,122 @@ def extract_all_from_pdf(
             "T200": 8,
         }
 
-    # E200 - Fixtures and Controls
     e200_page = sheet_map.get("E200", 2)
-    try:
-        print(f"  Extracting E200 (Lighting) from page {e200_page}...")
-        fixtures = extract_fixture_counts(pdf_path, e200_page)
-        controls = extract_controls(pdf_path, e200_page)
-        results['fixtures'] = fixtures
-        results['controls'] = controls
-        print(f"    Fixtures: {fixtures}")
-        print(f"    Controls: {controls}")
-    except Exception as e:
-        print(f"    Warning: E200 extraction failed: {e}")
-
-    # E201 - Power devices
     e201_page = sheet_map.get("E201", 3)
-    try:
-        print(f"  Extracting E201 (Power) from page {e201_page}...")
-        power = extract_power_devices(pdf_path, e201_page)
-        results['power'] = power
-        print(f"    Power: {power}")
-    except Exception as e:
-        print(f"    Warning: E201 extraction failed: {e}")
-
-    # E100 - Demo items (enhanced extraction)
     e100_page = sheet_map.get("E100", 1)
-    try:
-        print(f"  Extracting E100 (Demo) from page {e100_page}...")
-        demo = extract_demo_items_enhanced(pdf_path, e100_page, sheet_map, floor_count)
-        results['demo'] = demo
-        print(f"    Demo: {demo}")
-    except Exception as e:
-        print(f"    Warning: E100 extraction failed: {e}")
-        # Fallback to basic extraction
+    t200_page = sheet_map.get("T200", 8)
+    e700_page = sheet_map.get("E700", 5)
+    e600_page = sheet_map.get("E600", 4)
+    floor_pages = {k: v for k, v in sheet_map.items() if k.startswith("E2")}
+
+    # Each sheet is extracted independently, so they can run side by side
+    tasks = {
+        'fixtures': (extract_fixture_counts, (pdf_path, e200_page)),
+        'controls': (extract_controls, (pdf_path, e200_page)),
+        'power': (extract_power_devices, (pdf_path, e201_page)),
+        'demo': (extract_demo_items_enhanced, (pdf_path, e100_page, sheet_map, floor_count)),
+        'technology': (extract_technology_enhanced, (pdf_path, t200_page, sheet_map, floor_count)),
+        'panel': (extract_panel_breakers, (pdf_path, e700_page)),
+    }
+    if floor_pages:
+        tasks['linear_leds'] = (
+            count_linear_leds_with_distribution, (pdf_path, floor_pages, floor_count)
+        )
+        tasks['pendants'] = (
+            count_pendants_from_floor_plans, (pdf_path, floor_pages, floor_count)
+        )
+
+    # Serially, open the PDF once; every sheet extractor reads its pages from
+    # the shared cache instead of reopening and re-parsing the file. If it
+    # can't be opened, each extractor fails on its own and is reported per
+    # sheet, as before. Worker processes open the PDF themselves.
+    cache = None
+    if not parallel:
         try:
-            demo = extract_demo_items(pdf_path, e100_page, floor_count)
-            results['demo'] = demo
+            cache = _PageCache.open(pdf_path)
         except Exception:
             pass
 
-    # T200 - Technology (enhanced extraction)
-    t200_page = sheet_map.get("T200", 8)
     try:
+        outcomes = _run_tasks(tasks, parallel, cache)
+
+        # Report in sheet order regardless of which task finished first
+        # E200 - Fixtures and Controls
+        print(f"  Extracting E200 (Lighting) from page {e200_page}...")
+        fixtures, controls = outcomes['fixtures'], outcomes['controls']
+        error = next((r for r in (fixtures, controls) if isinstance(r, Exception)), None)
+        if error is None:
+            results['fixtures'] = fixtures
+            results['controls'] = controls
+            print(f"    Fixtures: {fixtures}")
+            print(f"    Controls: {controls}")
+        else:
+            print(f"    Warning: E200 extraction failed: {error}")
+
+        # E201 - Power devices
+        print(f"  Extracting E201 (Power) from page {e201_page}...")
+        power = outcomes['power']
+        if not isinstance(power, Exception):
+            results['power'] = power
+            print(f"    Power: {power}")
+        else:
+            print(f"    Warning: E201 extraction failed: {power}")
+
+        # E100 - Demo items (enhanced extraction)
+        print(f"  Extracting E100 (Demo) from page {e100_page}...")
+        demo = outcomes['demo']
+        if not isinstance(demo, Exception):
+            results['demo'] = demo
+            print(f"    Demo: {demo}")
+        else:
+            print(f"    Warning: E100 extraction failed: {demo}")
+            # Fallback to basic extraction
+            try:
+                results['demo'] = extract_demo_items(pdf_path, e100_page, floor_count, cache=cache)
+            except Exception:
+                pass
+
+        # T200 - Technology (enhanced extraction)
         print(f"  Extracting T200 (Technology) from page {t200_page}...")
-        tech = extract_technology_enhanced(pdf_path, t200_page, sheet_map, floor_count)
-        results['technology'] = tech
-        print(f"    Technology: {tech}")
-    except Exception as e:
-        print(f"    Warning: T200 extraction failed: {e}")
-        # Fallback to basic extraction
-        try:
-            tech = extract_technology(pdf_path, t200_page, floor_count)
+        tech = outcomes['technology']
+        if not isinstance(tech, Exception):
             results['technology'] = tech
-        except Exception:
-            pass
-
-    # E700 - Panel schedule
-    e700_page = sheet_map.get("E700", 5)
-    try:
+            print(f"    Technology: {tech}")
+        else:
+            print(f"    Warning: T200 extraction failed: {tech}")
+            # Fallback to basic extraction
+            try:
+                results['technology'] = extract_technology(pdf_path, t200_page, floor_count, cache=cache)
+            except Exception:
+                pass
+
+        # E700 - Panel schedule
         print(f"  Extracting E700 (Panel) from page {e700_page}...")
-        panel = extract_panel_breakers(pdf_path, e700_page)
-        results['panel'] = panel
-        print(f"    Panel: {panel}")
-    except Exception as e:
-        print(f"    Warning: E700 extraction failed: {e}")
-
-    # E600 - Linear LEDs and Pendants (from schedule + floor plan counting)
-    e600_page = sheet_map.get("E600", 4)
-    try:
+        panel = outcomes['panel']
+        if not isinstance(panel, Exception):
+            results['panel'] = panel
+            print(f"    Panel: {panel}")
+        else:
+            print(f"    Warning: E700 extraction failed: {panel}")
+
+        # E600 - Linear LEDs and Pendants (from schedule + floor plan counting)
         print(f"  Extracting E600 (Fixture Schedule) from page {e600_page}...")
-
-        # Count Linear LEDs from floor plans
-        floor_pages = {k: v for k, v in sheet_map.items() if k.startswith("E2")}
         if floor_pages:
-            linear_counts = count_linear_leds_with_distribution(pdf_path, floor_pages, floor_count)
-            results['linear_leds'] = linear_counts
-            print(f"    Linear LEDs: {linear_counts}")
-
-            # Count Pendants from floor plans
-            pendant_counts = count_pendants_from_floor_plans(pdf_path, floor_pages, floor_count)
-            results['pendants'] = pendant_counts
-            print(f"    Pendants: {pendant_counts}")
-    except Exception as e:
-        print(f"    Warning: E600/Linear/Pendant extraction failed: {e}")
+            linear_counts, pendant_counts = outcomes['linear_leds'], outcomes['pendants']
+            if isinstance(linear_counts, Exception):
+                print(f"    Warning: E600/Linear/Pendant extraction failed: {linear_counts}")
+            else:
+                results['linear_leds'] = linear_counts
+                print(f"    Linear LEDs: {linear_counts}")
+
+                if isinstance(pendant_counts, Exception):
+                    print(f"    Warning: E600/Linear/Pendant extraction failed: {pendant_counts}")
+                else:
+                    results['pendants'] = pendant_counts
+                    print(f"    Pendants: {pendant_counts}")
+    finally:
+        if cache is not None:
+            cache.close()
 
     return results
 
@@ -1972,19 +2571,11 @@ def extract_all_to_device_counts(
     counts.technology = results.get('technology', {})
     counts.demo = results.get('demo', {})
 
-    # Add panel data to power category
-    panel = results.get('panel', {})
-    for item, count in panel.items():
-        counts.power[item] = count
-
-    # Add Linear LEDs to fixtures
-    linear_leds = results.get('linear_leds', {})
-    for item, count in linear_leds.items():
-        counts.fixtures[item] = count
+    # Add panel data to power category (panel entries overwrite same-named items)
+    counts.power.update(results.get('panel', {}))
 
-    # Add Pendants to fixtures
-    pendants = results.get('pendants', {})
-    for item, count in pendants.items():
-        counts.fixtures[item] = count
+    # Add Linear LEDs and Pendants to fixtures
+    counts.fixtures.update(results.get('linear_leds', {}))
+    counts.fixtures.update(results.get('pendants', {}))
 
     return counts
@@ -4,6 +4,11 @@ from pathlib import Path
 from typing import List, Tuple
 from PIL import Image
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
 from .models import Sheet, SheetType
 
 
@@ -51,12 +56,17 @@ def extract_pages_from_pdf(pdf_path: str, output_dir: str, dpi: int = 200) -> Li
     Returns:
         List of paths to extracted images
     """
+    # Render in-process when PyMuPDF is available; pdf2image is the fallback
+    if fitz is not None:
+        return _render_pages_with_pymupdf(pdf_path, output_dir, dpi)
+
     try:
         from pdf2image import convert_from_path
     except ImportError:
         raise ImportError(
-            "pdf2image is required. Install with: pip install pdf2image\n"
-            "Also requires poppler: brew install poppler (macOS) or apt install poppler-utils (Linux)"
+            "PyMuPDF or pdf2image is required. Install with: pip install pymupdf\n"
+            "or: pip install pdf2image (also requires poppler: brew install poppler (macOS) "
+            "or apt install poppler-utils (Linux))"
         )
 
     os.makedirs(output_dir, exist_ok=True)
@@ -74,6 +84,32 @@ def extract_pages_from_pdf(pdf_path: str, output_dir: str, dpi: int = 200) -> Li
     return image_paths
 
 
+def _render_pages_with_pymupdf(pdf_path: str, output_dir: str, dpi: int) -> List[str]:
+    """
+    Render PDF pages to PNG in-process with PyMuPDF.
+
+    Unlike pdf2image this doesn't spawn pdftoppm or pass every page through
+    an intermediate PPM, and only one page's pixmap is held at a time.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    zoom = dpi / 72
+    matrix = fitz.Matrix(zoom, zoom)
+
+    image_paths = []
+    doc = fitz.open(pdf_path)
+    try:
+        for i, page in enumerate(doc, 1):
+            image_path = os.path.join(output_dir, f"page-{i:02d}.png")
+            page.get_pixmap(matrix=matrix, alpha=False).save(image_path)
+            image_paths.append(image_path)
+            print(f"Extracted page {i} -> {image_path}")
+    finally:
+        doc.close()
+
+    return image_paths
+
+
 # Known sheet structure for IVCC CETLA project
 IVCC_SHEET_MAP = {
     1: ("E000", "ELECTRICAL OVERSHEET", SheetType.LEGEND),
@@ -4,12 +4,13 @@ This module estimates conduit runs and wire lengths from floor plans
 using AI vision analysis, PDF vector extraction, and device-based estimation methods.
 """
 import base64
+import io
 import json
 import os
 import re
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional
 
 from PIL import Image
 
@@ -17,12 +18,17 @@ from .models import ConduitCounts, RoutingData
 from .pdf_extractor import extract_conduit_lengths, analyze_drawing_elements
 
 
-def resize_image_if_needed(image_path: str, max_dimension: int = 6000) -> str:
-    """Resize image if it exceeds the max dimension limit."""
+def resize_image_in_memory(image_path: str, max_dimension: int = 6000) -> Optional[bytes]:
+    """
+    Resize image if it exceeds the max dimension limit.
+
+    The resized image is encoded in memory in the source format, so nothing
+    is written to disk. Returns None if the image is already small enough.
+    """
     with Image.open(image_path) as img:
         width, height = img.size
         if width <= max_dimension and height <= max_dimension:
-            return image_path
+            return None
 
         if width > height:
             new_width = max_dimension
@@ -33,23 +39,19 @@ def resize_image_if_needed(image_path: str, max_dimension: int = 6000) -> str:
 
         resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
-        suffix = Path(image_path).suffix
-        fd, temp_path = tempfile.mkstemp(suffix=suffix)
-        os.close(fd)
-        resized.save(temp_path)
+        buffer = io.BytesIO()
+        resized.save(buffer, format=img.format or "PNG")
 
-        return temp_path
+        return buffer.getvalue()
 
 
-def encode_image_to_base64(image_path: str) -> Tuple[str, str]:
-    """Encode image to base64, resizing if needed. Returns (data, temp_path or None)."""
-    processed_path = resize_image_if_needed(image_path)
+def encode_image_to_base64(image_path: str) -> str:
+    """Encode an image file to base64, resizing if needed."""
+    image_bytes = resize_image_in_memory(image_path)
+    if image_bytes is None:
+        image_bytes = Path(image_path).read_bytes()
 
-    with open(processed_path, "rb") as f:
-        data = base64.standard_b64encode(f.read()).decode("utf-8")
-
-    temp_created = processed_path if processed_path != image_path else None
-    return data, temp_created
+    return base64.standard_b64encode(image_bytes).decode("utf-8")
 
 
 def get_media_type(image_path: str) -> str:
@@ -145,7 +147,8 @@ Return calculated wire quantities in feet.
 
 def estimate_conduit_with_ai(
     image_path: str,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    image_data: Optional[str] = None
 ) -> ConduitCounts:
     """
     Use Claude Vision to estimate conduit runs from a floor plan.
@@ -153,6 +156,8 @@ def estimate_conduit_with_ai(
     Args:
         image_path: Path to floor plan image (E200 or E201)
         api_key: Anthropic API key (or uses ANTHROPIC_API_KEY env var)
+        image_data: Optional base64 image already produced by
+                    encode_image_to_base64(image_path)
 
     Returns:
         ConduitCounts with estimated lengths
@@ -169,31 +174,28 @@ def estimate_conduit_with_ai(
     client = anthropic.Anthropic(api_key=api_key)
 
     # Encode image
-    image_data, temp_path = encode_image_to_base64(image_path)
+    if image_data is None:
+        image_data = encode_image_to_base64(image_path)
     media_type = get_media_type(image_path)
 
-    try:
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2048,
-            messages=[{
-                "role": "user",
-                "content": [
-                    {
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": media_type,
-                            "data": image_data,
-                        },
+    message = client.messages.create(
+        model="claude-sonnet-4-20250514",
+        max_tokens=2048,
+        messages=[{
+            "role": "user",
+            "content": [
+                {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": media_type,
+                        "data": image_data,
                     },
-                    {"type": "text", "text": CONDUIT_ROUTING_PROMPT}
-                ],
-            }],
-        )
-    finally:
-        if temp_path:
-            os.remove(temp_path)
+                },
+                {"type": "text", "text": CONDUIT_ROUTING_PROMPT}
+            ],
+        }],
+    )
 
     # Parse response
     response_text = message.content[0].text
@@ -463,28 +465,39 @@ def analyze_routing_complete(
 
     # Fall back to AI vision if PDF vectors didn't work
     if not combined_conduit.conduit_by_size and use_ai:
-        print("  Analyzing E200 (Lighting) routing with AI...")
-        try:
-            lighting_conduit = estimate_conduit_with_ai(e200_path, api_key)
-            for size, length in lighting_conduit.conduit_by_size.items():
-                combined_conduit.conduit_by_size[size] = (
-                    combined_conduit.conduit_by_size.get(size, 0) + length
-                )
-            result.estimated_method = "ai_vision"
-        except Exception as e:
-            print(f"    Warning: AI routing failed for E200: {e}")
-            use_ai = False
+        # Resize and encode E201 while the E200 request is in flight. E201 is
+        # only sent if E200 succeeds; otherwise its encoding is cancelled or,
+        # if already running, abandoned rather than waited for
+        executor = ThreadPoolExecutor(max_workers=1)
+        e201_encoding = executor.submit(encode_image_to_base64, e201_path)
 
-        if use_ai:
-            print("  Analyzing E201 (Power) routing with AI...")
+        try:
+            print("  Analyzing E200 (Lighting) routing with AI...")
             try:
-                power_conduit = estimate_conduit_with_ai(e201_path, api_key)
-                for size, length in power_conduit.conduit_by_size.items():
+                lighting_conduit = estimate_conduit_with_ai(e200_path, api_key)
+                for size, length in lighting_conduit.conduit_by_size.items():
                     combined_conduit.conduit_by_size[size] = (
                         combined_conduit.conduit_by_size.get(size, 0) + length
                     )
+                result.estimated_method = "ai_vision"
             except Exception as e:
-                print(f"    Warning: AI routing failed for E201: {e}")
+                print(f"    Warning: AI routing failed for E200: {e}")
+                use_ai = False
+
+            if use_ai:
+                print("  Analyzing E201 (Power) routing with AI...")
+                try:
+                    power_conduit = estimate_conduit_with_ai(
+                        e201_path, api_key, image_data=e201_encoding.result()
+                    )
+                    for size, length in power_conduit.conduit_by_size.items():
+                        combined_conduit.conduit_by_size[size] = (
+                            combined_conduit.conduit_by_size.get(size, 0) + length
+                        )
+                except Exception as e:
+                    print(f"    Warning: AI routing failed for E201: {e}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     # If all else failed, use device-based estimation
     if not combined_conduit.conduit_by_size:
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Regression tests for pdf_extractor behaviour changes.
+
+Each test builds a small synthetic PDF with PyMuPDF, so no project
+drawings are needed.
+
+Usage:
+    python3 test_extraction_regressions.py
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def _make_pdf(directory: str, name: str, draw) -> str:
+    """Create a one-page letter-size PDF, letting draw(page) add content."""
+    import fitz
+
+    pdf_path = str(Path(directory) / name)
+    doc = fitz.open()
+    page = doc.new_page(width=612, height=792)
+    draw(page)
+    doc.save(pdf_path)
+    doc.close()
+    return pdf_path
+
+
+def test_fill_only_paths():
+    """Fill-only paths are left out of line and conduit lengths."""
+    print("=" * 60)
+    print("TEST: Fill-Only Paths in Vector Lengths")
+    print("=" * 60)
+
+    try:
+        import fitz  # noqa: F401
+    except ImportError:
+        print("WARNING: PyMuPDF not installed. Install with: pip install pymupdf")
+        print("Skipping fill-only path test.")
+        return True  # Not a failure, just skip
+
+    from takeoff_system.pdf_extractor import (
+        analyze_drawing_elements,
+        extract_conduit_lengths,
+        extract_line_lengths,
+    )
+
+    def draw(page):
+        # One 4" (288pt) stroked run = 32' at 1/8" scale...
+        page.draw_line((72, 72), (360, 72), color=(0, 0, 0), width=0.5)
+        # ...and a filled symbol with no stroke (PyMuPDF reports width None)
+        page.draw_polyline(
+            [(100, 200), (172, 200), (136, 272), (100, 200)],
+            color=None, fill=(0, 0, 0), closePath=True
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = _make_pdf(tmp, "fill_only.pdf", draw)
+        conduit = extract_conduit_lengths(pdf_path, 0)
+        lines = extract_line_lengths(pdf_path, 0)
+        stats = analyze_drawing_elements(pdf_path, 0)
+
+    print(f"\n  Conduit: {conduit}")
+    print(f"  Lines: {lines}")
+    print(f"  Drawing stats: {stats['line_counts_by_width']}")
+
+    return (
+        conduit == {'3/4"': 32}
+        and lines == {"width_0.50": 32.0}
+        # Whole-page statistics still include the fill outline
+        and stats['line_counts_by_width'] == {0.5: 1, None: 3}
+    )
+
+
+def test_apportion_without_floor():
+    """Fallback size mixes add up to the detected total, even for small totals."""
+    print("\n" + "=" * 60)
+    print("TEST: Fallback Size Apportioning")
+    print("=" * 60)
+
+    from takeoff_system.pdf_extractor import _F11_RATIOS, _LINEAR_RATIOS, _apportion
+
+    # Three F11 pendants used to become 1 of every size (5 in total)
+    shares = _apportion(3, _F11_RATIOS)
+    print(f"\n  3 x F11: {shares}")
+
+    expected = {
+        "F11-4X4": 1,
+        "F11-6X6": 1,
+        "F11-8X8": 0,
+        "F11-10X10": 1,
+        "F11-16X10": 0,
+    }
+    if shares != expected:
+        print(f"  Expected: {expected}")
+        return False
+
+    for total in range(50):
+        for ratios in (_F11_RATIOS, _LINEAR_RATIOS):
+            if sum(_apportion(total, ratios).values()) != total:
+                print(f"  Shares of {total} don't add up: {_apportion(total, ratios)}")
+                return False
+
+    return True
+
+
+def test_linear_led_tags():
+    """Each linear tag counts toward one length; FF99 only looks a few characters ahead."""
+    print("\n" + "=" * 60)
+    print("TEST: Linear LED Tag Counting")
+    print("=" * 60)
+
+    try:
+        import fitz  # noqa: F401
+    except ImportError:
+        print("WARNING: PyMuPDF not installed. Install with: pip install pymupdf")
+        print("Skipping linear LED tag test.")
+        return True  # Not a failure, just skip
+
+    from takeoff_system.pdf_extractor import count_linear_leds_from_floor_plans
+
+    def draw(page):
+        # One tag per line. The old greedy FF99.* patterns also read the
+        # panel name "LP-8" as an 8' linear, and "FF99-4" followed by "F9-6"
+        # as a second 4' linear.
+        for row, tag in enumerate(["F9-16", "FF99-4", "F9-6", "FF99 TO LP-8"]):
+            page.insert_text((72, 100 + 30 * row), tag, fontsize=10)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = _make_pdf(tmp, "linear_tags.pdf", draw)
+        counts = count_linear_leds_from_floor_plans(pdf_path, {'E200': 0}, floor_count=1)
+
+    print(f"\n  Linear LEDs: {counts}")
+
+    expected = {
+        "4' Linear LED": 1,
+        "6' Linear LED": 1,
+        "8' Linear LED": 0,
+        "10' Linear LED": 0,
+        "16' Linear LED": 1,
+    }
+    if counts != expected:
+        print(f"  Expected: {expected}")
+        return False
+
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "=" * 70)
+    print("MEP TAKEOFF SYSTEM - EXTRACTION REGRESSION TESTS")
+    print("=" * 70)
+
+    results = []
+
+    results.append(("Fill-Only Paths", test_fill_only_paths()))
+    results.append(("Apportioning", test_apportion_without_floor()))
+    results.append(("Linear LED Tags", test_linear_led_tags()))
+
+    print("\n" + "=" * 70)
+    print("TEST RESULTS SUMMARY")
+    print("=" * 70)
+
+    all_passed = True
+    for name, passed in results:
+        status = "PASS" if passed else "FAIL"
+        print(f"  {name}: {status}")
+        if not passed:
+            all_passed = False
+
+    print("-" * 70)
+    if all_passed:
+        print("All tests passed!")
+        return 0
+    else:
+        print("Some tests failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())